@@ -15,21 +15,22 @@ import asyncio
 import contextlib
 import functools
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import open_gopro.models.proto.cohn_pb2 as cohn_proto
 import open_gopro.models.proto.response_generic_pb2 as response_proto
-from open_gopro.models.constants import ActionId, FeatureId
+from open_gopro.models.constants import ActionId, FeatureId, StatusId
 
 from .ble_uuid import GoProBleUUID
 from .commands import BleCommands, HttpCommands, MediaCommands, MediaFile, WebcamCommands
-from .config import CohnConfigManager, CohnCredentials, TimeoutConfig
+from .config import DEFAULT_TIMEOUT_CONFIG, CohnConfigManager, CohnCredentials, TimeoutConfig
 from .connection import BleConnectionManager, HealthCheckMixin, HttpConnectionManager
-from .exceptions import BleConnectionError
-from .state_parser import parse_camera_state
+from .exceptions import BleConnectionError, HttpConnectionError
+from .state_parser import get_raw_status_value, parse_camera_state
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,38 @@ class OfflineModeError(Exception):
     pass
 
 
+def _offline_mode_error(feature_name: str, target: str | None) -> OfflineModeError:
+    """Build the error raised when an online-only feature is used in offline mode.
+
+    Kept out of the decorator wrapper so the online path only pays for a single attribute check.
+
+    Args:
+        feature_name: Feature name for error message
+        target: Camera identifier shown in the suggested fix
+
+    Returns:
+        OfflineModeError with usage hints
+    """
+    return OfflineModeError(
+        f"❌ {feature_name} requires online mode (BLE+WiFi) to use\n"
+        f"Solutions:\n"
+        f"  1. Set offline_mode=False when creating client\n"
+        f"     >>> client = GoProClient('{target}', offline_mode=False)\n"
+        f"  2. Or switch to online mode at runtime\n"
+        f"     >>> await client.switch_to_online_mode(wifi_ssid='...', wifi_password='...')\n"
+        f"\n"
+        f"Offline mode supports basic features via BLE:\n"
+        f"  ✅ start_recording() / stop_recording()\n"
+        f"  ✅ set_date_time()\n"
+        f"  ✅ tag_hilight()\n"
+        f"  ✅ load_preset() / load_preset_group()\n"
+        f"  ✅ sleep()\n"
+        f"  ❌ Preview (start_preview)\n"
+        f"  ❌ Download media (download_media)\n"
+        f"  ❌ Manage files (list_media, delete_media)"
+    )
+
+
 def _require_online(feature_name: str):
     """Decorator that ensures the method is called in online mode.
 
@@ -54,24 +87,7 @@ def _require_online(feature_name: str):
         @functools.wraps(func)
         async def wrapper(self: GoProClient, *args, **kwargs):
             if self._offline_mode:
-                raise OfflineModeError(
-                    f"❌ {feature_name} requires online mode (BLE+WiFi) to use\n"
-                    f"Solutions:\n"
-                    f"  1. Set offline_mode=False when creating client\n"
-                    f"     >>> client = GoProClient('{self.target}', offline_mode=False)\n"
-                    f"  2. Or switch to online mode at runtime\n"
-                    f"     >>> await client.switch_to_online_mode(wifi_ssid='...', wifi_password='...')\n"
-                    f"\n"
-                    f"Offline mode supports basic features via BLE:\n"
-                    f"  ✅ start_recording() / stop_recording()\n"
-                    f"  ✅ set_date_time()\n"
-                    f"  ✅ tag_hilight()\n"
-                    f"  ✅ load_preset() / load_preset_group()\n"
-                    f"  ✅ sleep()\n"
-                    f"  ❌ Preview (start_preview)\n"
-                    f"  ❌ Download media (download_media)\n"
-                    f"  ❌ Manage files (list_media, delete_media)"
-                )
+                raise _offline_mode_error(feature_name, self.target)
             return await func(self, *args, **kwargs)
 
         return wrapper
@@ -148,7 +164,7 @@ class GoProClient(HealthCheckMixin):
 
         self.target = target
         self._offline_mode = offline_mode
-        self._timeout = timeout_config or TimeoutConfig()
+        self._timeout = timeout_config or DEFAULT_TIMEOUT_CONFIG
         self._config_manager = config_manager or CohnConfigManager()
         self._wifi_ssid = wifi_ssid
         self._wifi_password = wifi_password
@@ -168,6 +184,9 @@ class GoProClient(HealthCheckMixin):
         self._max_reconnect_attempts = self._timeout.max_reconnect_attempts
         self._last_health_check: float | None = None
 
+        # Smoothed time-to-ready observed by wait_camera_ready (seconds), used to adapt the poll interval
+        self._ready_wait_ewma = self._timeout.camera_ready_poll_interval
+
         mode_str = "Offline mode (BLE only)" if offline_mode else "Online mode (BLE+WiFi)"
         logger.info(f"Initializing GoProClient, target camera: {target}, mode: {mode_str}")
 
@@ -261,6 +280,8 @@ class GoProClient(HealthCheckMixin):
 
     async def close(self) -> None:
         """Close all connections."""
+        await self.http_commands.stop_keep_alive()
+
         # Only disconnect connections that are actually connected
         # In offline mode, http was never connected, so we shouldn't call disconnect
         if self.http.is_connected:
@@ -618,6 +639,55 @@ class GoProClient(HealthCheckMixin):
         raw_state = await self.get_camera_state()
         return parse_camera_state(raw_state)
 
+    @_require_online("Wait for camera ready")
+    async def wait_camera_ready(self, timeout: float | None = None, poll_interval: float | None = None) -> None:
+        """Wait until the camera is neither busy nor encoding.
+
+        The first check is sent immediately. While the camera is busy, polling is spaced out
+        according to how long previous waits took, and falls back to `poll_interval`
+        once the wait approaches the usual time-to-ready.
+
+        Args:
+            timeout: Maximum wait time (seconds), defaults to `TimeoutConfig.camera_ready_timeout`
+            poll_interval: Minimum status polling interval (seconds),
+                defaults to `TimeoutConfig.camera_ready_poll_interval`
+
+        Raises:
+            OfflineModeError: This feature is not supported in offline mode
+            TimeoutError: Camera did not become ready within timeout
+        """
+        timeout = self._timeout.camera_ready_timeout if timeout is None else timeout
+        poll_interval = self._timeout.camera_ready_poll_interval if poll_interval is None else poll_interval
+
+        expected = self._ready_wait_ewma
+        relaxed_interval = max(poll_interval, expected * 0.25)
+
+        start = time.monotonic()
+        failures = 0
+        while True:
+            try:
+                raw_state = await self.http_commands.get_camera_state()
+                busy = get_raw_status_value(raw_state, StatusId.BUSY)
+                encoding = get_raw_status_value(raw_state, StatusId.ENCODING)
+                elapsed = time.monotonic() - start
+                if not busy and not encoding:
+                    self._ready_wait_ewma = 0.8 * expected + 0.2 * elapsed
+                    logger.debug(f"Camera {self.target} ready after {elapsed:.2f}s")
+                    return
+                # Poll sparsely early on, then at full rate near the usual time-to-ready
+                interval = relaxed_interval if elapsed < expected * 0.75 else poll_interval
+                failures = 0
+            except HttpConnectionError as e:
+                logger.debug(f"Camera ready check failed: {e}")
+                # Transient failures usually clear quickly: retry fast first, then back off to poll_interval
+                interval = min(poll_interval, 0.1 * (1 << failures))
+                failures += 1
+
+            elapsed = time.monotonic() - start
+            if elapsed >= timeout:
+                raise TimeoutError(f"Camera {self.target} not ready within {timeout:.1f}s")
+            await asyncio.sleep(min(interval, timeout - elapsed))
+
     @_require_online("Get camera info")
     async def get_camera_info(self) -> dict[str, Any]:
         """Get camera information.
@@ -639,6 +709,22 @@ class GoProClient(HealthCheckMixin):
         """
         await self.http_commands.set_keep_alive()
 
+    @_require_online("Keep-alive signal")
+    async def start_keep_alive(self, interval: float = 3.0) -> None:
+        """Send keep-alive signals in the background until stop_keep_alive or close.
+
+        Args:
+            interval: Time between keep-alive signals (seconds)
+
+        Raises:
+            OfflineModeError: This feature is not supported in offline mode
+        """
+        await self.http_commands.start_keep_alive(interval)
+
+    async def stop_keep_alive(self) -> None:
+        """Stop background keep-alive signals (no-op if not running)."""
+        await self.http_commands.stop_keep_alive()
+
     # ==================== Date Time (delegated to http_commands) ====================
 
     async def set_date_time(self, dt: datetime | None = None, tz_offset: int = 0, is_dst: bool = False) -> None:
@@ -697,6 +783,33 @@ class GoProClient(HealthCheckMixin):
         """
         await self.http_commands.set_setting(setting_id, value)
 
+    @_require_online("Get settings")
+    async def get_settings(self, setting_ids: list[int]) -> dict[int, Any]:
+        """Get the values of multiple settings (requested concurrently).
+
+        Args:
+            setting_ids: Setting IDs
+
+        Returns:
+            Dictionary of setting ID -> setting value
+
+        Raises:
+            OfflineModeError: This feature is not supported in offline mode
+        """
+        return await self.http_commands.get_settings(setting_ids)
+
+    @_require_online("Set settings")
+    async def set_settings(self, settings: dict[int, int]) -> None:
+        """Modify multiple settings (requested concurrently, in no particular order).
+
+        Args:
+            settings: Dictionary of setting ID -> setting value
+
+        Raises:
+            OfflineModeError: This feature is not supported in offline mode
+        """
+        await self.http_commands.set_settings(settings)
+
     # ==================== Preset Management (delegated to http_commands) ====================
 
     @_require_online("Get preset status")
@@ -802,6 +915,30 @@ class GoProClient(HealthCheckMixin):
         """
         return await self.media_commands.download_file(media_file, save_path, progress_callback)
 
+    @_require_online("Media download")
+    async def download_files(
+        self,
+        media_files: list[MediaFile | str],
+        directory: str | Path,
+        concurrency: int = 3,
+        progress_callback: Callable[[str, int, int], None] | None = None,
+    ) -> list[int | BaseException]:
+        """Download multiple media files concurrently (Turbo mode is enabled during the batch).
+
+        Args:
+            media_files: MediaFile objects or file paths
+            directory: Destination directory
+            concurrency: Maximum downloads in flight at once
+            progress_callback: Progress callback function (file_path: str, downloaded: int, total: int) -> None
+
+        Returns:
+            Number of bytes downloaded (or the raised exception) per file, in input order
+
+        Raises:
+            OfflineModeError: This feature is not supported in offline mode
+        """
+        return await self.media_commands.download_files(media_files, directory, concurrency, progress_callback)
+
     @_require_online("Delete media file")
     async def delete_file(self, path: str) -> None:
         """Delete single media file.
@@ -1025,12 +1162,7 @@ class GoProClient(HealthCheckMixin):
         )
 
         # Validate credentials completeness
-        if not all([
-            credentials.ip_address,
-            credentials.username,
-            credentials.password,
-            credentials.certificate,
-        ]):
+        if not (credentials.ip_address and credentials.username and credentials.password and credentials.certificate):
             raise BleConnectionError(
                 f"Credentials incomplete: "
                 f"ip={bool(credentials.ip_address)}, "
@@ -1140,13 +1272,14 @@ class GoProClient(HealthCheckMixin):
             logger.error(error_msg)
             raise BleConnectionError(error_msg) from e
 
-    async def scan_wifi_networks(self, timeout: float | None = None) -> list[Any]:
+    async def scan_wifi_networks(self, timeout: float | None = None, target_ssid: str | None = None) -> list[Any]:
         """Scan WiFi networks.
 
         Note: Camera must be in AP mode (not connected to any network) to scan.
 
         Args:
             timeout: Scan timeout (seconds), defaults to configured value
+            target_ssid: Only look for this SSID (returns at most one network)
 
         Returns:
             List of WiFi networks
@@ -1154,7 +1287,24 @@ class GoProClient(HealthCheckMixin):
         Raises:
             BleConnectionError: Scan failed (possibly camera already connected to network)
         """
-        return await self.ble_commands.scan_wifi_networks(timeout)
+        return await self.ble_commands.scan_wifi_networks(timeout, target_ssid)
+
+    def iter_wifi_networks(self, timeout: float | None = None) -> AsyncIterator[dict[str, Any]]:
+        """Scan WiFi networks, yielding each network as it is received.
+
+        Note: Camera must be in AP mode (not connected to any network) to scan.
+
+        Args:
+            timeout: Scan timeout (seconds), defaults to configured value
+
+        Returns:
+            Async iterator of WiFi networks
+
+        Usage example:
+            >>> async for network in client.iter_wifi_networks():
+            ...     print(network["ssid"])
+        """
+        return self.ble_commands.iter_wifi_networks(timeout)
 
     async def connect_to_wifi(self, ssid: str, password: str | None = None, timeout: float | None = None) -> None:
         """Connect to WiFi network.
@@ -7,8 +7,19 @@ Commands categorized by function:
 - Webcam commands: Webcam mode control
 """
 
-from .base import *  # noqa: F403
-from .ble_commands import *  # noqa: F403
-from .http_commands import *  # noqa: F403
-from .media_commands import *  # noqa: F403
-from .webcam_commands import *  # noqa: F403
+__all__ = [
+    "BleCommands",
+    "CircuitBreaker",
+    "HttpCommands",
+    "MediaCommands",
+    "MediaFile",
+    "WebcamCommands",
+    "http_retry_deadline",
+    "with_http_retry",
+]
+
+from .base import CircuitBreaker, http_retry_deadline, with_http_retry
+from .ble_commands import BleCommands
+from .http_commands import HttpCommands
+from .media_commands import MediaCommands, MediaFile
+from .webcam_commands import WebcamCommands
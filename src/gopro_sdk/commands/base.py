@@ -1,67 +1,400 @@
 """Command base classes and decorators."""
 
-__all__ = ["with_http_retry"]
+__all__ = ["CircuitBreaker", "http_retry_deadline", "with_http_retry"]
 
 import asyncio
+import contextlib
 import functools
 import logging
-from collections.abc import Awaitable, Callable
-from typing import ParamSpec, TypeVar
+import random
+import time
+from collections.abc import Awaitable, Callable, Generator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, ParamSpec, Protocol, TypeVar
 
-from ..exceptions import HttpConnectionError
+import aiohttp
+
+from ..exceptions import HttpConnectionError, UnrecoverableHttpError
 
 logger = logging.getLogger(__name__)
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# Monotonic time after which HTTP commands stop retrying (set via http_retry_deadline)
+_deadline_var: ContextVar[float | None] = ContextVar("gopro_http_deadline", default=None)
+
+
+class _RetryGateOwner(Protocol):
+    """Command instance sharing one backoff among its concurrent failing commands.
+
+    The gate resolves to the error of the shared retry, or None if it succeeded or was
+    cancelled (waiting commands then send their own request).
+    """
+
+    _http_retry_gate: asyncio.Future[HttpConnectionError | None] | None
+
+
+@dataclass
+class CircuitBreaker:
+    """Circuit breaker for HTTP commands of one camera.
+
+    State machine:
+        CLOSED --(failure_threshold consecutive failures)--> OPEN
+        OPEN --(open_duration elapsed)--> HALF_OPEN
+        HALF_OPEN --(probe succeeds)--> CLOSED
+        HALF_OPEN --(probe fails)--> OPEN
+
+    While OPEN, `with_http_retry` fails fast instead of waiting through
+    the full backoff schedule against an endpoint that is known to be down.
+
+    Attributes:
+        failure_threshold: Consecutive failures before the circuit opens
+        open_duration: Time the circuit stays open before probing again (seconds)
+        half_open_probes: Concurrent probe requests allowed while half-open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    failure_threshold: int = 5
+    open_duration: float = 10.0
+    half_open_probes: int = 1
+    state: str = field(default=CLOSED, init=False)
+    failures: int = field(default=0, init=False)
+    opened_at: float = field(default=0.0, init=False)
+    _probes_in_flight: int = field(default=0, init=False, repr=False)
+
+    def allow(self) -> bool:
+        """Check whether a request may be sent, moving OPEN -> HALF_OPEN once open_duration has elapsed.
+
+        Returns:
+            True if the request may proceed
+        """
+        if self.state == self.CLOSED:
+            return True
+
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.open_duration:
+                return False
+            self.state = self.HALF_OPEN
+            logger.info("🔌 HTTP circuit half-open, probing camera")
+
+        if self._probes_in_flight >= self.half_open_probes:
+            return False
+        self._probes_in_flight += 1
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful request (closes the circuit)."""
+        if self.state != self.CLOSED:
+            logger.info("✅ HTTP circuit closed")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probes_in_flight = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request (may open the circuit)."""
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning("⚠️ HTTP circuit open after %d failures, failing fast", self.failures)
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._probes_in_flight = 0
+
+    def release(self) -> None:
+        """Release a half-open probe slot whose request ended without an HTTP outcome (e.g. cancelled)."""
+        if self._probes_in_flight:
+            self._probes_in_flight -= 1
+
+    def remaining_open_time(self) -> float:
+        """Get the time left before the circuit allows a probe (seconds)."""
+        return max(0.0, self.open_duration - (time.monotonic() - self.opened_at))
+
+
+async def _check_response(resp: aiohttp.ClientResponse, message: str) -> None:
+    """Raise `HttpConnectionError` unless the camera answered 200.
+
+    The response body is only read on failure, to include the camera's error text.
+
+    Args:
+        resp: HTTP response
+        message: Error message prefix, e.g. "Failed to get state"
+
+    Raises:
+        UnrecoverableHttpError: Camera rejected the request (400, 404, 422)
+        HttpConnectionError: Any other status than 200
+    """
+    if resp.status == 200:
+        return
+    text = await resp.text()
+    raise HttpConnectionError.from_status(resp.status, f"{message} (HTTP {resp.status}): {text}")
+
+
+@contextlib.contextmanager
+def http_retry_deadline(timeout: float) -> Generator[None]:
+    """Limit the total time HTTP commands may spend retrying within this context.
+
+    Backoff sleeps are shortened to the remaining budget, and once it is used up a failing
+    command raises its last error instead of retrying. Nested deadlines never extend an outer one.
+
+    Args:
+        timeout: Retry budget from now (seconds)
+
+    Usage example:
+        >>> with http_retry_deadline(5.0):
+        ...     await client.get_camera_state()
+    """
+    deadline = time.monotonic() + timeout
+    outer = _deadline_var.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+    token = _deadline_var.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline_var.reset(token)
+
 
 def with_http_retry(
-    max_retries: int = 3, backoff_factor: float = 1.0
+    max_retries: int = 3,
+    backoff_factor: float = 1.0,
+    max_backoff: float = 30.0,
+    per_attempt_timeout: float | None = None,
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
     """HTTP command retry decorator.
 
     Automatically retries failed HTTP commands using exponential backoff strategy.
+    Backoff delays are jittered (x0.5-1.5) so concurrent failing commands don't retry in lockstep.
+
+    If the command instance (first positional arg) has a `_http_breaker` (`CircuitBreaker`),
+    calls fail fast with `HttpConnectionError` while the circuit is open. If it has a
+    `_http_retry_gate` attribute, concurrent failing commands share one backoff: the first
+    one sleeps and retries, the others wait for that retry and only send their own request
+    once it succeeded. A failed shared retry uses up an attempt of each waiting command, which
+    takes over its error; the failure is only recorded once, by the command that sent it.
+
+    `UnrecoverableHttpError` is never retried: the camera answered, so it also counts as a
+    success for the circuit breaker.
 
     Args:
         max_retries: Maximum retry count
         backoff_factor: Backoff factor (seconds)
+        max_backoff: Upper bound for a single backoff delay (seconds)
+        per_attempt_timeout: Time limit for a single attempt (seconds). An attempt that hangs
+            longer fails with `HttpConnectionError` and is retried like any other failure.
+            None (default) means no limit beyond the HTTP session timeout.
 
     Returns:
         Decorated function
 
+    Raises:
+        ValueError: Invalid retry configuration (checked once, when the decorator is created)
+
     Usage example:
         >>> @with_http_retry(max_retries=3, backoff_factor=2.0)
         ... async def my_http_command(self):
         ...     # HTTP command implementation
         ...     pass
     """
+    if max_retries < 1:
+        raise ValueError(f"max_retries must be >= 1, got {max_retries}")
+    if backoff_factor < 0 or max_backoff < 0:
+        raise ValueError(f"backoff_factor and max_backoff must be >= 0, got {backoff_factor}, {max_backoff}")
+    if per_attempt_timeout is not None and per_attempt_timeout <= 0:
+        raise ValueError(f"per_attempt_timeout must be > 0, got {per_attempt_timeout}")
+
+    return _retry_decorator(max_retries, backoff_factor, max_backoff, per_attempt_timeout)
+
+
+@functools.cache
+def _retry_decorator(
+    max_retries: int, backoff_factor: float, max_backoff: float, per_attempt_timeout: float | None
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Build the decorator for one retry configuration.
+
+    Cached, so all commands sharing a configuration share one decorator and one backoff schedule.
+    """
+    delays = tuple(backoff_factor * (1 << i) for i in range(max_retries - 1))
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        call = func if per_attempt_timeout is None else _with_attempt_timeout(func, per_attempt_timeout)
 
-    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
         @functools.wraps(func)
-        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            last_error: HttpConnectionError | None = None
-
-            for attempt in range(max_retries):
-                try:
-                    return await func(*args, **kwargs)
-                except HttpConnectionError as e:
-                    last_error = e
-                    # Assume first arg is self with _http_error_count
-                    if args and hasattr(args[0], "_http_error_count"):
-                        args[0]._http_error_count += 1  # type: ignore[union-attr]
-
-                    if attempt < max_retries - 1:
-                        wait_time = backoff_factor * (2**attempt)
-                        logger.warning(f"HTTP command failed (attempt {attempt + 1}/{max_retries}): {e}")
-                        logger.info(f"Waiting {wait_time:.1f} seconds before retry...")
-                        await asyncio.sleep(wait_time)
-                    else:
-                        logger.error(f"HTTP command failed (reached maximum retry count {max_retries})")
-
-            assert last_error is not None  # Type guard: last_error is always set if we reach here
-            raise last_error
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            breaker: CircuitBreaker | None = getattr(args[0], "_http_breaker", None) if args else None
+            if breaker is not None and not breaker.allow():
+                raise HttpConnectionError(
+                    f"HTTP circuit open, request skipped (retry in {breaker.remaining_open_time():.1f}s)"
+                )
+
+            # Fast path: a single await, retry state is only built once something fails
+            try:
+                result = await call(*args, **kwargs)
+            except UnrecoverableHttpError:
+                if breaker is not None:
+                    breaker.record_success()
+                raise
+            except HttpConnectionError as e:
+                return await _retry_slow_path(call, args, kwargs, e, breaker, delays, max_backoff)
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            if breaker is not None:
+                breaker.record_success()
+            return result
 
         return wrapper
 
     return decorator
+
+
+def _with_attempt_timeout[**Q, R](func: Callable[Q, Awaitable[R]], timeout: float) -> Callable[Q, Awaitable[R]]:
+    """Wrap a command so a single attempt exceeding `timeout` raises `HttpConnectionError`.
+
+    Args:
+        func: Command function
+        timeout: Time limit for one attempt (seconds)
+
+    Returns:
+        Wrapped command function
+    """
+
+    async def call(*args: Q.args, **kwargs: Q.kwargs) -> R:
+        try:
+            async with asyncio.timeout(timeout):
+                return await func(*args, **kwargs)
+        except TimeoutError as e:
+            raise HttpConnectionError(f"HTTP command timed out after {timeout:g}s") from e
+
+    return call
+
+
+async def _retry_slow_path[R](
+    func: Callable[..., Awaitable[R]],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    error: HttpConnectionError,
+    breaker: CircuitBreaker | None,
+    delays: tuple[float, ...],
+    max_backoff: float,
+) -> R:
+    """Retry loop entered after the first attempt of a `with_http_retry` command failed.
+
+    Args:
+        func: Decorated command function
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+        error: Error raised by the first attempt
+        breaker: Circuit breaker of the command instance, if any
+        delays: Base backoff delay before each retry (seconds), one entry per retry
+        max_backoff: Upper bound for a single backoff delay (seconds)
+
+    Returns:
+        Result of the first successful retry
+
+    Raises:
+        HttpConnectionError: Last error once all attempts are exhausted or the circuit opened
+    """
+    max_retries = len(delays) + 1
+    # Instances that define _http_retry_gate share one backoff among concurrent failing commands
+    instance: _RetryGateOwner | None = args[0] if args and hasattr(args[0], "_http_retry_gate") else None
+    # False while `error` was taken over from a shared retry (already recorded by the command that sent it)
+    record_failure = True
+
+    for attempt, delay in enumerate(delays):
+        if record_failure:
+            _record_http_failure(args, breaker)
+        record_failure = True
+        if breaker is not None and breaker.state == CircuitBreaker.OPEN:
+            logger.error("HTTP command failed, circuit open, not retrying: %s", error)
+            raise error
+
+        deadline = _deadline_var.get()
+        remaining = deadline - time.monotonic() if deadline is not None else max_backoff
+        if remaining < 0.001:
+            logger.error("HTTP command failed, retry deadline reached: %s", error)
+            raise error
+
+        shared = instance._http_retry_gate if instance is not None else None
+        if shared is not None:
+            # Another command is already backing off against this camera, reuse its retry outcome
+            logger.warning(
+                "HTTP command failed (attempt %d/%d), waiting for in-flight retry: %s",
+                attempt + 1,
+                max_retries,
+                error,
+                extra={"retry_attempt": attempt + 1, "retry_max": max_retries, "retry_wait": None},
+            )
+            shared_error = await asyncio.shield(shared)
+            if shared_error is not None:
+                error = shared_error
+                record_failure = False
+                continue
+            wait_time = 0.0
+        else:
+            wait_time = min(max_backoff, remaining, delay * random.uniform(0.5, 1.5)) if delay > 0 else 0.0  # noqa: S311
+            logger.warning(
+                "HTTP command failed (attempt %d/%d), retrying in %.1fs: %s",
+                attempt + 1,
+                max_retries,
+                wait_time,
+                error,
+                extra={"retry_attempt": attempt + 1, "retry_max": max_retries, "retry_wait": wait_time},
+            )
+
+        gate: asyncio.Future[HttpConnectionError | None] | None = None
+        outcome: HttpConnectionError | None = None
+        try:
+            if shared is None and instance is not None:
+                # No await between check and assignment, so no lock is needed on a single event loop.
+                # Created inside try: the gate is resolved even if this command is cancelled while sleeping
+                gate = instance._http_retry_gate = asyncio.get_running_loop().create_future()
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+
+            if breaker is not None and not breaker.allow():
+                logger.error("HTTP command failed, circuit open, not retrying: %s", error)
+                outcome = error
+                raise error
+
+            try:
+                result = await func(*args, **kwargs)
+            except UnrecoverableHttpError:
+                if breaker is not None:
+                    breaker.record_success()
+                raise
+            except HttpConnectionError as e:
+                error = outcome = e
+                continue
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+        finally:
+            if gate is not None and instance is not None:
+                instance._http_retry_gate = None
+                gate.set_result(outcome)
+
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+    if record_failure:
+        _record_http_failure(args, breaker)
+    logger.error("HTTP command failed (reached maximum retry count %d)", max_retries)
+    raise error
+
+
+def _record_http_failure(args: tuple[Any, ...], breaker: CircuitBreaker | None) -> None:
+    """Record a failed attempt on the command instance (first positional arg) and its circuit breaker."""
+    if args:
+        with contextlib.suppress(AttributeError):
+            args[0]._http_error_count += 1
+    if breaker is not None:
+        breaker.record_failure()
@@ -12,14 +12,18 @@ from __future__ import annotations
 __all__ = ["BleCommands"]
 
 import asyncio
+import contextlib
+import functools
 import logging
 import struct
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
 import open_gopro.models.proto.cohn_pb2 as cohn_proto
 import open_gopro.models.proto.network_management_pb2 as network_proto
 import open_gopro.models.proto.response_generic_pb2 as response_proto
+from google.protobuf.internal import api_implementation
 from open_gopro.models.constants import ActionId, CmdId, FeatureId
 from open_gopro.models.proto.network_management_pb2 import EnumProvisioning, EnumScanEntryFlags, EnumScanning
 from open_gopro.models.proto.response_generic_pb2 import RESULT_SUCCESS
@@ -27,10 +31,149 @@ from open_gopro.models.proto.response_generic_pb2 import RESULT_SUCCESS
 from ..ble_uuid import GoProBleUUID
 from ..config import CohnCredentials
 from ..connection.ble_manager import BleConnectionManager
-from ..exceptions import BleConnectionError, CohnConfigurationError
+from ..exceptions import BleConnectionError, CohnConfigurationError, WifiProvisioningError
 
 logger = logging.getLogger(__name__)
 
+if api_implementation.Type() == "python":
+    # upb (default since protobuf 4.21) parses/serializes messages an order of magnitude faster
+    logger.warning(
+        "⚠️ protobuf is using the pure-Python backend, BLE protobuf commands will be slow. "
+        "Install a protobuf>=4.21 wheel for this platform and unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION."
+    )
+
+# Set on the action ID of a protobuf response (e.g. REQUEST_GET_COHN_STATUS 0x6F -> 0xEF)
+_RESPONSE_ACTION_FLAG = 0x80
+
+# Precompiled big-endian packers for complete commands: [cmd_id, param_len, ...params]
+_pack_u16_command = struct.Struct(">BBH").pack
+# Date time params: year(uint16) + month + day + hour + minute + second
+_DATE_TIME_COMMAND = struct.Struct(">BBHBBBBB")
+# Date time params followed by tz_offset(int16) + is_dst(uint8)
+_DATE_TIME_DST_COMMAND = struct.Struct(">BBHBBBBBhB")
+
+# Constant TLV commands: [cmd_id] or [cmd_id, param_len, param_value]
+_SHUTTER_ON_COMMAND = bytes((CmdId.SET_SHUTTER, 0x01, 0x01))
+_SHUTTER_OFF_COMMAND = bytes((CmdId.SET_SHUTTER, 0x01, 0x00))
+_TAG_HILIGHT_COMMAND = bytes((CmdId.TAG_HILIGHT,))
+_SLEEP_COMMAND = bytes((CmdId.SLEEP,))
+_REBOOT_COMMAND = bytes((CmdId.REBOOT,))
+
+# COHN enum value -> name, resolved once instead of per status poll
+_COHN_STATUS_NAMES = {v.number: v.name for v in cohn_proto.EnumCOHNStatus.DESCRIPTOR.values}
+_COHN_STATE_NAMES = {v.number: v.name for v in cohn_proto.EnumCOHNNetworkState.DESCRIPTOR.values}
+# Result / provisioning state value -> name, for WiFi connect responses
+_RESULT_NAMES = {v.number: v.name for v in response_proto.EnumResultGeneric.DESCRIPTOR.values}
+_PROVISIONING_NAMES = {v.number: v.name for v in EnumProvisioning.DESCRIPTOR.values}
+_PROVISIONING_SUCCESS_STATES = frozenset({
+    EnumProvisioning.PROVISIONING_SUCCESS_NEW_AP,
+    EnumProvisioning.PROVISIONING_SUCCESS_OLD_AP,
+})
+_PROVISIONING_STARTED = EnumProvisioning.PROVISIONING_STARTED
+# Terminal provisioning error state -> user-facing reason
+_PROVISIONING_ERROR_MESSAGES = {
+    EnumProvisioning.PROVISIONING_ABORTED_BY_SYSTEM: "Connection aborted by system",
+    EnumProvisioning.PROVISIONING_CANCELLED_BY_USER: "Connection cancelled by user",
+    EnumProvisioning.PROVISIONING_ERROR_FAILED_TO_ASSOCIATE: "Failed to associate to AP (signal too weak or AP unreachable)",
+    EnumProvisioning.PROVISIONING_ERROR_PASSWORD_AUTH: "Password authentication failed (incorrect password)",
+    EnumProvisioning.PROVISIONING_ERROR_EULA_BLOCKING: "EULA blocking (need to agree to user agreement)",
+    EnumProvisioning.PROVISIONING_ERROR_NO_INTERNET: "No internet connection",
+    EnumProvisioning.PROVISIONING_ERROR_UNSUPPORTED_TYPE: "Unsupported network type",
+}
+# RequestConnect failures that mean the saved credentials are stale, retried with RequestConnectNew
+_STALE_CREDENTIAL_STATES = frozenset({
+    EnumProvisioning.PROVISIONING_ERROR_FAILED_TO_ASSOCIATE,
+    EnumProvisioning.PROVISIONING_ERROR_PASSWORD_AUTH,
+})
+
+
+@functools.lru_cache(maxsize=64)
+def _protobuf_header(feature_id: int, action_id: int) -> bytes:
+    """Get the 2-byte [feature_id, action_id] prefix of a protobuf command (cached per pair)."""
+    return bytes((feature_id, action_id))
+
+
+def _prebuilt_protobuf_command(feature_id: int, action_id: int, protobuf_message: Any) -> bytes:
+    """Serialize a protobuf command whose request never changes, once at import time."""
+    return _protobuf_header(feature_id, action_id) + protobuf_message.SerializeToString()
+
+
+# Scan entries requested per GET_AP_ENTRIES round-trip (a typical scan fits in one page)
+_AP_ENTRIES_PAGE_SIZE = 100
+# Smaller pages when looking for one SSID, so reading can stop early without parsing the whole scan
+_AP_ENTRIES_TARGET_PAGE_SIZE = 20
+# Resolved once: attribute access on protobuf enum wrappers goes through __getattr__
+_SCAN_FLAG_CONFIGURED = EnumScanEntryFlags.SCAN_FLAG_CONFIGURED
+
+# Requests without per-call fields, sent as pre-serialized command bytes
+_RELEASE_NETWORK_COMMAND = _prebuilt_protobuf_command(
+    FeatureId.NETWORK_MANAGEMENT, ActionId.RELEASE_NETWORK, network_proto.RequestReleaseNetwork()
+)
+_START_SCAN_COMMAND = _prebuilt_protobuf_command(
+    FeatureId.NETWORK_MANAGEMENT, ActionId.SCAN_WIFI_NETWORKS, network_proto.RequestStartScan()
+)
+_CLEAR_COHN_CERT_COMMAND = _prebuilt_protobuf_command(
+    FeatureId.COMMAND, ActionId.REQUEST_CLEAR_COHN_CERT, cohn_proto.RequestClearCOHNCert()
+)
+_CREATE_COHN_CERT_COMMAND = _prebuilt_protobuf_command(
+    FeatureId.COMMAND, ActionId.REQUEST_CREATE_COHN_CERT, cohn_proto.RequestCreateCOHNCert(override=True)
+)
+_GET_COHN_CERT_COMMAND = _prebuilt_protobuf_command(
+    FeatureId.QUERY, ActionId.REQUEST_GET_COHN_CERT, cohn_proto.RequestCOHNCert()
+)
+# COHN status query, without registering for continuous status notifications: unsolicited pushes
+# would match no pending request and pile up in the response queue
+_GET_COHN_STATUS_COMMAND = _prebuilt_protobuf_command(
+    FeatureId.QUERY, ActionId.REQUEST_GET_COHN_STATUS, cohn_proto.RequestGetCOHNStatus(register_cohn_status=False)
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _request_connect_command(ssid: str) -> bytes:
+    """Get the RequestConnect command for an SSID (cached, retries and fallbacks reuse the bytes).
+
+    RequestConnectNew is never cached, its serialized bytes contain the WiFi password.
+    """
+    return _prebuilt_protobuf_command(
+        FeatureId.NETWORK_MANAGEMENT, ActionId.REQUEST_WIFI_CONNECT, network_proto.RequestConnect(ssid=ssid)
+    )
+
+
+async def _log_wait_progress(message: str, timeout: float, interval: float = 5.0) -> None:
+    """Log `message` with elapsed/total time every `interval` seconds until cancelled.
+
+    Run as a task alongside a long wait, so the wait itself needs no elapsed time bookkeeping.
+    """
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    while True:
+        await asyncio.sleep(interval)
+        logger.info("%s (%.0fs/%.0fs)", message, loop.time() - start_time, timeout)
+
+
+def _validate_ack(response_data: bytes, expected_cmd_id: int) -> None:
+    """Validate a TLV command response: [cmd_id, status_code].
+
+    Error messages are only formatted when a check fails.
+
+    Args:
+        response_data: Response bytes
+        expected_cmd_id: Command ID the response must echo
+
+    Raises:
+        BleConnectionError: Response is too short, for another command, or reports a non-success status
+    """
+    if len(response_data) < 2:
+        raise BleConnectionError(f"Response data too short: {len(response_data)} bytes")
+
+    cmd_id = response_data[0]
+    if cmd_id != expected_cmd_id:
+        raise BleConnectionError(f"Response command ID mismatch: expected {expected_cmd_id:#x}, got {cmd_id:#x}")
+
+    status_code = response_data[1]
+    if status_code:  # 0x00 = SUCCESS
+        raise BleConnectionError(f"status code {status_code:#x}")
+
 
 class BleCommands:
     """BLE command interface.
@@ -66,10 +209,26 @@ class BleCommands:
         Returns:
             Command data (feature_id + action_id + protobuf_data)
         """
-        proto_data = protobuf_message.SerializeToString()
         # Only includes feature_id + action_id + protobuf_data
         # Length byte is automatically added by the Open GoPro SDK's fragmentation logic
-        return bytes([feature_id, action_id]) + proto_data
+        return _protobuf_header(feature_id, action_id) + protobuf_message.SerializeToString()
+
+    async def _ble_rpc(self, uuid: str, command_data: bytes, timeout: float | None = None) -> bytes:
+        """Send a command and wait for its response.
+
+        The response queue is cleared first so old status notifications are not mistaken for the response.
+
+        Args:
+            uuid: BLE UUID to write to
+            command_data: Complete command bytes
+            timeout: Response timeout (seconds), None uses the BLE manager default
+
+        Returns:
+            Response data
+        """
+        self.ble.clear_response_queue()
+        await self.ble.write(uuid, command_data)
+        return await self.ble.wait_for_response(timeout=timeout)
 
     async def _send_protobuf_command(
         self,
@@ -91,25 +250,42 @@ class BleCommands:
         Returns:
             Parsed response
         """
-        # Clear response queue
-        self.ble.clear_response_queue()
-
-        # Build and send command
         command_data = self._build_protobuf_command(feature_id, action_id, request_proto)
-        logger.debug(f"📤 Sending protobuf command: feature={hex(feature_id)}, action={hex(action_id)}")
-        await self.ble.write(uuid, command_data)
+        return await self._send_raw_protobuf_command(command_data, response_proto_class, uuid)
+
+    async def _send_raw_protobuf_command(
+        self, command_data: bytes, response_proto_class: Any, uuid: str, timeout: float | None = None
+    ) -> Any:
+        """Send an already built protobuf command and wait for response.
+
+        Used directly for prebuilt commands and by polling loops that send the same request repeatedly.
 
-        # Wait for response
-        response_data = await self.ble.wait_for_response()
+        Args:
+            command_data: Command data from `_build_protobuf_command()`
+            response_proto_class: Response protobuf class
+            uuid: BLE UUID
+            timeout: Response timeout (seconds), None uses the BLE manager default
+
+        Returns:
+            Parsed response
+
+        Raises:
+            BleConnectionError: Response missing, too short or not parseable
+        """
+        logger.debug("📤 Sending protobuf command: feature=%#x, action=%#x", command_data[0], command_data[1])
+        # Protobuf responses echo the feature ID with the response bit (0x80) set on the action ID
+        response_data = await self.ble.write_and_await(
+            uuid, command_data, (command_data[0], command_data[1] | _RESPONSE_ACTION_FLAG), timeout
+        )
 
         # Parse response
-        logger.debug(f"📥 Received complete response: {len(response_data)} bytes")
+        logger.debug("📥 Received complete response: %d bytes", len(response_data))
 
         if len(response_data) < 2:
             raise BleConnectionError(f"Response data too short: {len(response_data)} bytes")
 
         # Skip feature_id and action_id, parse protobuf data
-        proto_data = response_data[2:]
+        proto_data = memoryview(response_data)[2:]
         response = response_proto_class()
 
         try:
@@ -122,6 +298,35 @@ class BleCommands:
 
     # ==================== Basic Control Commands ====================
 
+    async def _send_simple_command(self, command_data: bytes, description: str, timeout: float = 2.0) -> None:
+        """Send a TLV command to CQ_COMMAND and validate its response.
+
+        Command format: [cmd_id] or [cmd_id, param_len, ...param_bytes]
+        Response format: [cmd_id, status_code]
+        Reference: BleWriteCommand._build_data() implementation
+
+        Args:
+            command_data: Complete command bytes (first byte is the command ID)
+            description: Command description used in log and error messages
+            timeout: Response timeout (seconds), command responses normally arrive within 100ms
+
+        Raises:
+            BleConnectionError: Command send failed, timed out or camera returned an error status
+        """
+        expected_cmd_id = command_data[0]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📤 Sending %s command: %s", description, command_data.hex())
+
+        try:
+            response_data = await self._ble_rpc(GoProBleUUID.CQ_COMMAND, command_data, timeout)
+            _validate_ack(response_data, expected_cmd_id)
+        except TimeoutError as e:
+            logger.error(f"❌ {description} timeout")
+            raise BleConnectionError(f"{description} timeout") from e
+        except Exception as e:
+            logger.error(f"❌ {description} failed: {e}")
+            raise BleConnectionError(f"{description} failed: {e}") from e
+
     async def set_shutter(self, enable: bool) -> None:
         """Control recording shutter via BLE.
 
@@ -131,49 +336,14 @@ class BleCommands:
         Raises:
             BleConnectionError: Command send failed or response error
         """
-        shutter_value = 0x01 if enable else 0x00
         action = "Starting" if enable else "Stopping"
         logger.info(f"🎬 {action} recording (BLE command)...")
 
-        # Clear response queue (avoid interference from old status notifications)
-        self.ble.clear_response_queue()
-
-        # Build command: [cmd_id, param_len, param_value]
-        # Reference: BleWriteCommand._build_data() implementation
-        command_data = bytes([CmdId.SET_SHUTTER, 0x01, shutter_value])
-        logger.debug(f"📤 Sending shutter command: {command_data.hex()}")
-
-        try:
-            # Send command to CQ_COMMAND UUID
-            await self.ble.write(GoProBleUUID.CQ_COMMAND, command_data)
-
-            # Wait for response: [cmd_id, status_code]
-            # Command response should arrive within 100ms, 2 second timeout is sufficient
-            response_data = await self.ble.wait_for_response(timeout=2.0)
-
-            # Parse response
-            if len(response_data) < 2:
-                raise BleConnectionError(f"Response data too short: {len(response_data)} bytes")
-
-            cmd_id = response_data[0]
-            status_code = response_data[1]
+        # Command: [cmd_id, param_len, param_value]
+        command_data = _SHUTTER_ON_COMMAND if enable else _SHUTTER_OFF_COMMAND
+        await self._send_simple_command(command_data, f"{action} recording")
 
-            if cmd_id != CmdId.SET_SHUTTER:
-                raise BleConnectionError(
-                    f"Response command ID mismatch: expected {CmdId.SET_SHUTTER:#x}, got {cmd_id:#x}"
-                )
-
-            if status_code != 0x00:  # 0x00 = SUCCESS
-                raise BleConnectionError(f"Shutter command failed: status code {status_code:#x}")
-
-            logger.info(f"✅ {action} recording successful")
-
-        except TimeoutError as e:
-            logger.error(f"❌ {action} recording timeout")
-            raise BleConnectionError(f"{action} recording timeout") from e
-        except Exception as e:
-            logger.error(f"❌ {action} recording failed: {e}")
-            raise BleConnectionError(f"{action} recording failed: {e}") from e
+        logger.info(f"✅ {action} recording successful")
 
     async def set_date_time(self, dt: datetime | None = None, tz_offset: int = 0, is_dst: bool = False) -> None:
         """Set camera date and time via BLE.
@@ -191,59 +361,39 @@ class BleCommands:
 
         logger.info(f"🕐 Setting camera time: {dt.strftime('%Y-%m-%d %H:%M:%S')}")
 
-        # Clear response queue
-        self.ble.clear_response_queue()
-
-        # Build time parameters (reference: DateTimeByteParserBuilder.build)
-        # Format: year(2-byte big-endian) + month + day + hour + minute + second
+        # Build command: [cmd_id, param_len, ...time params] (reference: DateTimeByteParserBuilder.build)
+        # Params: year(2-byte big-endian) + month + day + hour + minute + second
         #         [+ tz_offset(2-byte signed big-endian) + is_dst(1-byte)] (optional)
-        time_bytes = bytearray()
-        time_bytes.extend(struct.pack(">H", dt.year))  # Year (big-endian uint16)
-        time_bytes.extend([dt.month, dt.day, dt.hour, dt.minute, dt.second])
-
-        # Choose command based on timezone/DST info
         if tz_offset != 0 or is_dst:
             # Use SET_DATE_TIME_DST (0x0F), includes timezone and DST
-            cmd_id = CmdId.SET_DATE_TIME_DST
-            time_bytes.extend(struct.pack(">h", tz_offset))  # Timezone offset (signed)
-            time_bytes.append(0x01 if is_dst else 0x00)  # DST flag
+            command_data = _DATE_TIME_DST_COMMAND.pack(
+                CmdId.SET_DATE_TIME_DST,
+                _DATE_TIME_DST_COMMAND.size - 2,
+                dt.year,
+                dt.month,
+                dt.day,
+                dt.hour,
+                dt.minute,
+                dt.second,
+                tz_offset,
+                0x01 if is_dst else 0x00,
+            )
         else:
             # Use SET_DATE_TIME (0x0D), no timezone info
-            cmd_id = CmdId.SET_DATE_TIME
-
-        # Build command: [cmd_id, param_len, ...param_bytes]
-        param_len = len(time_bytes)
-        command_data = bytes([cmd_id, param_len]) + bytes(time_bytes)
-        logger.debug(f"📤 Sending time sync command: {command_data.hex()}")
-
-        try:
-            # Send command to CQ_COMMAND UUID
-            await self.ble.write(GoProBleUUID.CQ_COMMAND, command_data)
-
-            # Wait for response: [cmd_id, status_code]
-            response_data = await self.ble.wait_for_response(timeout=2.0)
-
-            # Parse response
-            if len(response_data) < 2:
-                raise BleConnectionError(f"Response data too short: {len(response_data)} bytes")
-
-            resp_cmd_id = response_data[0]
-            status_code = response_data[1]
-
-            if resp_cmd_id != cmd_id:
-                raise BleConnectionError(f"Response command ID mismatch: expected {cmd_id:#x}, got {resp_cmd_id:#x}")
-
-            if status_code != 0x00:  # 0x00 = SUCCESS
-                raise BleConnectionError(f"Time sync failed: status code {status_code:#x}")
+            command_data = _DATE_TIME_COMMAND.pack(
+                CmdId.SET_DATE_TIME,
+                _DATE_TIME_COMMAND.size - 2,
+                dt.year,
+                dt.month,
+                dt.day,
+                dt.hour,
+                dt.minute,
+                dt.second,
+            )
 
-            logger.info("✅ Time sync successful")
+        await self._send_simple_command(command_data, "Time sync")
 
-        except TimeoutError as e:
-            logger.error("❌ Time sync timeout")
-            raise BleConnectionError("Time sync timeout") from e
-        except Exception as e:
-            logger.error(f"❌ Time sync failed: {e}")
-            raise BleConnectionError(f"Time sync failed: {e}") from e
+        logger.info("✅ Time sync successful")
 
     async def tag_hilight(self) -> None:
         """Tag highlight during recording via BLE.
@@ -253,40 +403,10 @@ class BleCommands:
         """
         logger.info("🏷️ Tagging highlight (BLE command)...")
 
-        # Clear response queue
-        self.ble.clear_response_queue()
-
-        # Build command: [cmd_id] (no parameters)
-        command_data = bytes([CmdId.TAG_HILIGHT])
-        logger.debug(f"📤 Sending tag hilight command: {command_data.hex()}")
-
-        try:
-            await self.ble.write(GoProBleUUID.CQ_COMMAND, command_data)
-
-            response_data = await self.ble.wait_for_response(timeout=2.0)
-
-            if len(response_data) < 2:
-                raise BleConnectionError(f"Response data too short: {len(response_data)} bytes")
+        # Command: [cmd_id] (no parameters)
+        await self._send_simple_command(_TAG_HILIGHT_COMMAND, "Tag hilight")
 
-            cmd_id = response_data[0]
-            status_code = response_data[1]
-
-            if cmd_id != CmdId.TAG_HILIGHT:
-                raise BleConnectionError(
-                    f"Response command ID mismatch: expected {CmdId.TAG_HILIGHT:#x}, got {cmd_id:#x}"
-                )
-
-            if status_code != 0x00:
-                raise BleConnectionError(f"Tag hilight failed: status code {status_code:#x}")
-
-            logger.info("✅ Highlight tagged successfully")
-
-        except TimeoutError as e:
-            logger.error("❌ Tag hilight timeout")
-            raise BleConnectionError("Tag hilight timeout") from e
-        except Exception as e:
-            logger.error(f"❌ Tag hilight failed: {e}")
-            raise BleConnectionError(f"Tag hilight failed: {e}") from e
+        logger.info("✅ Highlight tagged successfully")
 
     async def load_preset(self, preset_id: int) -> None:
         """Load specified preset via BLE.
@@ -299,40 +419,11 @@ class BleCommands:
         """
         logger.info(f"📋 Loading preset {preset_id} (BLE command)...")
 
-        # Clear response queue
-        self.ble.clear_response_queue()
-
         # Build command: [cmd_id, param_len, preset_id (2 bytes big-endian)]
-        command_data = bytes([CmdId.LOAD_PRESET, 0x02]) + struct.pack(">H", preset_id)
-        logger.debug(f"📤 Sending load preset command: {command_data.hex()}")
-
-        try:
-            await self.ble.write(GoProBleUUID.CQ_COMMAND, command_data)
+        command_data = _pack_u16_command(CmdId.LOAD_PRESET, 0x02, preset_id)
+        await self._send_simple_command(command_data, f"Load preset {preset_id}")
 
-            response_data = await self.ble.wait_for_response(timeout=2.0)
-
-            if len(response_data) < 2:
-                raise BleConnectionError(f"Response data too short: {len(response_data)} bytes")
-
-            cmd_id = response_data[0]
-            status_code = response_data[1]
-
-            if cmd_id != CmdId.LOAD_PRESET:
-                raise BleConnectionError(
-                    f"Response command ID mismatch: expected {CmdId.LOAD_PRESET:#x}, got {cmd_id:#x}"
-                )
-
-            if status_code != 0x00:
-                raise BleConnectionError(f"Load preset failed: status code {status_code:#x}")
-
-            logger.info(f"✅ Preset {preset_id} loaded successfully")
-
-        except TimeoutError as e:
-            logger.error(f"❌ Load preset {preset_id} timeout")
-            raise BleConnectionError(f"Load preset {preset_id} timeout") from e
-        except Exception as e:
-            logger.error(f"❌ Load preset {preset_id} failed: {e}")
-            raise BleConnectionError(f"Load preset {preset_id} failed: {e}") from e
+        logger.info(f"✅ Preset {preset_id} loaded successfully")
 
     async def load_preset_group(self, group_id: int) -> None:
         """Load preset group via BLE.
@@ -345,40 +436,11 @@ class BleCommands:
         """
         logger.info(f"📋 Loading preset group {group_id} (BLE command)...")
 
-        # Clear response queue
-        self.ble.clear_response_queue()
-
         # Build command: [cmd_id, param_len, group_id (2 bytes big-endian)]
-        command_data = bytes([CmdId.LOAD_PRESET_GROUP, 0x02]) + struct.pack(">H", group_id)
-        logger.debug(f"📤 Sending load preset group command: {command_data.hex()}")
-
-        try:
-            await self.ble.write(GoProBleUUID.CQ_COMMAND, command_data)
-
-            response_data = await self.ble.wait_for_response(timeout=2.0)
-
-            if len(response_data) < 2:
-                raise BleConnectionError(f"Response data too short: {len(response_data)} bytes")
-
-            cmd_id = response_data[0]
-            status_code = response_data[1]
-
-            if cmd_id != CmdId.LOAD_PRESET_GROUP:
-                raise BleConnectionError(
-                    f"Response command ID mismatch: expected {CmdId.LOAD_PRESET_GROUP:#x}, got {cmd_id:#x}"
-                )
-
-            if status_code != 0x00:
-                raise BleConnectionError(f"Load preset group failed: status code {status_code:#x}")
+        command_data = _pack_u16_command(CmdId.LOAD_PRESET_GROUP, 0x02, group_id)
+        await self._send_simple_command(command_data, f"Load preset group {group_id}")
 
-            logger.info(f"✅ Preset group {group_id} loaded successfully")
-
-        except TimeoutError as e:
-            logger.error(f"❌ Load preset group {group_id} timeout")
-            raise BleConnectionError(f"Load preset group {group_id} timeout") from e
-        except Exception as e:
-            logger.error(f"❌ Load preset group {group_id} failed: {e}")
-            raise BleConnectionError(f"Load preset group {group_id} failed: {e}") from e
+        logger.info(f"✅ Preset group {group_id} loaded successfully")
 
     async def sleep(self) -> None:
         """Put camera to sleep via BLE.
@@ -388,38 +450,10 @@ class BleCommands:
         """
         logger.info("😴 Putting camera to sleep (BLE command)...")
 
-        # Clear response queue
-        self.ble.clear_response_queue()
-
-        # Build command: [cmd_id] (no parameters)
-        command_data = bytes([CmdId.SLEEP])
-        logger.debug(f"📤 Sending sleep command: {command_data.hex()}")
-
-        try:
-            await self.ble.write(GoProBleUUID.CQ_COMMAND, command_data)
-
-            response_data = await self.ble.wait_for_response(timeout=2.0)
-
-            if len(response_data) < 2:
-                raise BleConnectionError(f"Response data too short: {len(response_data)} bytes")
-
-            cmd_id = response_data[0]
-            status_code = response_data[1]
+        # Command: [cmd_id] (no parameters)
+        await self._send_simple_command(_SLEEP_COMMAND, "Sleep command")
 
-            if cmd_id != CmdId.SLEEP:
-                raise BleConnectionError(f"Response command ID mismatch: expected {CmdId.SLEEP:#x}, got {cmd_id:#x}")
-
-            if status_code != 0x00:
-                raise BleConnectionError(f"Sleep command failed: status code {status_code:#x}")
-
-            logger.info("✅ Camera is going to sleep")
-
-        except TimeoutError as e:
-            logger.error("❌ Sleep command timeout")
-            raise BleConnectionError("Sleep command timeout") from e
-        except Exception as e:
-            logger.error(f"❌ Sleep command failed: {e}")
-            raise BleConnectionError(f"Sleep command failed: {e}") from e
+        logger.info("✅ Camera is going to sleep")
 
     async def reboot(self) -> None:
         """Reboot camera via BLE.
@@ -429,38 +463,10 @@ class BleCommands:
         """
         logger.info("🔄 Rebooting camera (BLE command)...")
 
-        # Clear response queue
-        self.ble.clear_response_queue()
-
-        # Build command: [cmd_id] (no parameters)
-        command_data = bytes([CmdId.REBOOT])
-        logger.debug(f"📤 Sending reboot command: {command_data.hex()}")
-
-        try:
-            await self.ble.write(GoProBleUUID.CQ_COMMAND, command_data)
-
-            response_data = await self.ble.wait_for_response(timeout=2.0)
-
-            if len(response_data) < 2:
-                raise BleConnectionError(f"Response data too short: {len(response_data)} bytes")
-
-            cmd_id = response_data[0]
-            status_code = response_data[1]
-
-            if cmd_id != CmdId.REBOOT:
-                raise BleConnectionError(f"Response command ID mismatch: expected {CmdId.REBOOT:#x}, got {cmd_id:#x}")
-
-            if status_code != 0x00:
-                raise BleConnectionError(f"Reboot command failed: status code {status_code:#x}")
+        # Command: [cmd_id] (no parameters)
+        await self._send_simple_command(_REBOOT_COMMAND, "Reboot command")
 
-            logger.info("✅ Camera is rebooting")
-
-        except TimeoutError as e:
-            logger.error("❌ Reboot command timeout")
-            raise BleConnectionError("Reboot command timeout") from e
-        except Exception as e:
-            logger.error(f"❌ Reboot command failed: {e}")
-            raise BleConnectionError(f"Reboot command failed: {e}") from e
+        logger.info("✅ Camera is rebooting")
 
     # ==================== Network Management Commands ====================
 
@@ -476,13 +482,9 @@ class BleCommands:
         """
         logger.info("📡 Disconnecting camera WiFi connection...")
 
-        request = network_proto.RequestReleaseNetwork()
-
         try:
-            await self._send_protobuf_command(
-                feature_id=FeatureId.NETWORK_MANAGEMENT.value,
-                action_id=ActionId.RELEASE_NETWORK,
-                request_proto=request,
+            await self._send_raw_protobuf_command(
+                _RELEASE_NETWORK_COMMAND,
                 response_proto_class=response_proto.ResponseGeneric,
                 uuid=GoProBleUUID.CQ_COMMAND,
             )
@@ -504,24 +506,20 @@ class BleCommands:
         """
         logger.debug("🔍 Querying COHN status")
 
-        request = cohn_proto.RequestGetCOHNStatus()
-        request.register_cohn_status = False  # Don't register continuous monitoring, query once only
-
         try:
-            # Send request, action_id is REQUEST_GET_COHN_STATUS (0x6F)
+            # Send request (without registering continuous monitoring, query once only),
+            # action_id is REQUEST_GET_COHN_STATUS (0x6F)
             # Response action_id will be RESPONSE_GET_COHN_STATUS (0xEF)
-            response = await self._send_protobuf_command(
-                feature_id=FeatureId.QUERY.value,
-                action_id=ActionId.REQUEST_GET_COHN_STATUS,
-                request_proto=request,
+            response = await self._send_raw_protobuf_command(
+                _GET_COHN_STATUS_COMMAND,
                 response_proto_class=cohn_proto.NotifyCOHNStatus,
                 uuid=GoProBleUUID.CQ_QUERY,
             )
 
             logger.info(
                 f"✅ COHN status: "
-                f"status={cohn_proto.EnumCOHNStatus.Name(response.status)}, "
-                f"state={cohn_proto.EnumCOHNNetworkState.Name(response.state)}, "
+                f"status={_COHN_STATUS_NAMES.get(response.status, '?')}, "
+                f"state={_COHN_STATE_NAMES.get(response.state, '?')}, "
                 f"ssid={response.ssid or 'N/A'}, "
                 f"ip={response.ipaddress or 'N/A'}"
             )
@@ -552,56 +550,35 @@ class BleCommands:
 
             # Step 1: Clear old certificate
             logger.debug("Clearing old COHN certificate...")
-            clear_request = cohn_proto.RequestClearCOHNCert()
-            await self._send_protobuf_command(
-                feature_id=FeatureId.COMMAND,
-                action_id=ActionId.REQUEST_CLEAR_COHN_CERT,
-                request_proto=clear_request,
+            await self._send_raw_protobuf_command(
+                _CLEAR_COHN_CERT_COMMAND,
                 response_proto_class=response_proto.ResponseGeneric,
                 uuid=GoProBleUUID.CQ_COMMAND,
             )
 
             # Step 2: Create new certificate
             logger.debug("Creating new COHN certificate...")
-            create_request = cohn_proto.RequestCreateCOHNCert()
-            create_request.override = True
-            await self._send_protobuf_command(
-                feature_id=FeatureId.COMMAND,
-                action_id=ActionId.REQUEST_CREATE_COHN_CERT,
-                request_proto=create_request,
+            await self._send_raw_protobuf_command(
+                _CREATE_COHN_CERT_COMMAND,
                 response_proto_class=response_proto.ResponseGeneric,
                 uuid=GoProBleUUID.CQ_COMMAND,
             )
 
             # Step 3: Poll status until PROVISIONED
             logger.info("⏳ Waiting for COHN certificate generation and camera to connect to WiFi...")
-            await self._wait_for_cohn_provisioned(timeout=self._timeout.cohn_wait_provisioned_timeout)
+            status_response = await self._wait_for_cohn_provisioned(timeout=self._timeout.cohn_wait_provisioned_timeout)
 
             # Step 4: Get credentials
             logger.debug("Retrieving COHN credentials...")
 
             # Get certificate
-            cert_request = cohn_proto.RequestCOHNCert()
-            cert_response = await self._send_protobuf_command(
-                feature_id=FeatureId.QUERY,
-                action_id=ActionId.REQUEST_GET_COHN_CERT,
-                request_proto=cert_request,
+            cert_response = await self._send_raw_protobuf_command(
+                _GET_COHN_CERT_COMMAND,
                 response_proto_class=cohn_proto.ResponseCOHNCert,
                 uuid=GoProBleUUID.CQ_QUERY,
             )
 
-            # Get status
-            status_request = cohn_proto.RequestGetCOHNStatus()
-            status_request.register_cohn_status = False
-            status_response = await self._send_protobuf_command(
-                feature_id=FeatureId.QUERY,
-                action_id=ActionId.REQUEST_GET_COHN_STATUS,
-                request_proto=status_request,
-                response_proto_class=cohn_proto.NotifyCOHNStatus,
-                uuid=GoProBleUUID.CQ_QUERY,
-            )
-
-            # Assemble credentials
+            # Assemble credentials (IP/username/password come from the provisioned status polled above)
             credentials = CohnCredentials(
                 ip_address=status_response.ipaddress,
                 username=status_response.username,
@@ -610,12 +587,9 @@ class BleCommands:
             )
 
             # Validate credential completeness
-            if not all([
-                credentials.ip_address,
-                credentials.username,
-                credentials.password,
-                credentials.certificate,
-            ]):
+            if not (
+                credentials.ip_address and credentials.username and credentials.password and credentials.certificate
+            ):
                 raise CohnConfigurationError("Credentials incomplete")
 
             logger.info(f"✅ Camera {self.ble.target} COHN configuration successful: {credentials.ip_address}")
@@ -626,12 +600,15 @@ class BleCommands:
             logger.error(msg)
             raise CohnConfigurationError(msg) from e
 
-    async def _wait_for_cohn_provisioned(self, timeout: float | None = None) -> None:
+    async def _wait_for_cohn_provisioned(self, timeout: float | None = None) -> cohn_proto.NotifyCOHNStatus:
         """Poll and wait for COHN status to become PROVISIONED.
 
         Args:
             timeout: Timeout duration (seconds), defaults to configured value
 
+        Returns:
+            The provisioned COHN status (includes IP address, username and password)
+
         Raises:
             TimeoutError: Timeout occurred
         """
@@ -642,63 +619,68 @@ class BleCommands:
         start_time = loop.time()
         interval = self._timeout.cohn_status_poll_interval
 
-        while True:
-            elapsed = loop.time() - start_time
-            if elapsed > timeout:
-                error_msg = (
-                    f"COHN configuration timeout ({timeout} seconds)\n"
-                    f"Possible causes:\n"
-                    f"1. Router WiFi password incorrect\n"
-                    f"2. WiFi signal too weak\n"
-                    f"3. Router DHCP service abnormal\n"
-                    f"Suggestion: Check network status on camera screen"
-                )
-                logger.error(error_msg)
-                raise TimeoutError(error_msg)
-
-            # Query status
-            is_first_query = loop.time() - start_time < 1
-            status_request = cohn_proto.RequestGetCOHNStatus()
-            status_request.register_cohn_status = is_first_query
-
-            status_response = await self._send_protobuf_command(
-                feature_id=FeatureId.QUERY,
-                action_id=ActionId.REQUEST_GET_COHN_STATUS,
-                request_proto=status_request,
-                response_proto_class=cohn_proto.NotifyCOHNStatus,
-                uuid=GoProBleUUID.CQ_QUERY,
-            )
-
-            # Display status name
-            status_name = cohn_proto.EnumCOHNStatus.Name(status_response.status)
-            state_name = cohn_proto.EnumCOHNNetworkState.Name(status_response.state)
-            elapsed = loop.time() - start_time
-            has_ip = bool(status_response.ipaddress) and bool(status_response.ipaddress.strip())
-
-            logger.info(
-                f"⏳ COHN configuration progress ({elapsed:.0f}s): "
-                f"status={status_name}, network={state_name}, "
-                f"IP={'✅ ' + status_response.ipaddress if has_ip else '⏳ Waiting...'}"
-            )
+        # One deadline for the whole wait (covers in-flight queries too), instead of checking elapsed time per poll
+        deadline = asyncio.timeout(timeout)
+        try:
+            async with deadline:
+                while True:
+                    # Query status (polled, status notifications are not registered)
+                    status_response = await self._send_raw_protobuf_command(
+                        _GET_COHN_STATUS_COMMAND,
+                        response_proto_class=cohn_proto.NotifyCOHNStatus,
+                        uuid=GoProBleUUID.CQ_QUERY,
+                    )
 
-            # Check if completed (relaxed condition: allow connecting state if has IP)
-            # In some cases camera state may be COHN_STATE_ConnectingToNetwork, but actually available
-            is_provisioned = status_response.status == cohn_proto.EnumCOHNStatus.COHN_PROVISIONED
-            is_connected = status_response.state == cohn_proto.EnumCOHNNetworkState.COHN_STATE_NetworkConnected
-            is_connecting = status_response.state == cohn_proto.EnumCOHNNetworkState.COHN_STATE_ConnectingToNetwork
-
-            # Completion condition: provisioned + (connected OR (connecting and has IP))
-            if is_provisioned and (is_connected or (is_connecting and has_ip)):
-                if is_connecting:
-                    logger.info(
-                        f"📌 Camera state is {state_name}, but has IP ({status_response.ipaddress}), considered configured"
+                    has_ip = bool(status_response.ipaddress) and bool(status_response.ipaddress.strip())
+
+                    # Display status name (only resolved when progress is actually logged)
+                    if logger.isEnabledFor(logging.INFO):
+                        status_name = _COHN_STATUS_NAMES.get(status_response.status, "?")
+                        state_name = _COHN_STATE_NAMES.get(status_response.state, "?")
+                        elapsed = loop.time() - start_time
+                        logger.info(
+                            f"⏳ COHN configuration progress ({elapsed:.0f}s): "
+                            f"status={status_name}, network={state_name}, "
+                            f"IP={'✅ ' + status_response.ipaddress if has_ip else '⏳ Waiting...'}"
+                        )
+
+                    # Check if completed (relaxed condition: allow connecting state if has IP)
+                    # In some cases camera state may be COHN_STATE_ConnectingToNetwork, but actually available
+                    is_provisioned = status_response.status == cohn_proto.EnumCOHNStatus.COHN_PROVISIONED
+                    is_connected = status_response.state == cohn_proto.EnumCOHNNetworkState.COHN_STATE_NetworkConnected
+                    is_connecting = (
+                        status_response.state == cohn_proto.EnumCOHNNetworkState.COHN_STATE_ConnectingToNetwork
                     )
-                logger.info(f"✅ COHN configuration complete! IP: {status_response.ipaddress}")
-                return
 
-            await asyncio.sleep(interval)
+                    # Completion condition: provisioned + (connected OR (connecting and has IP))
+                    if is_provisioned and (is_connected or (is_connecting and has_ip)):
+                        if is_connecting:
+                            logger.info(
+                                f"📌 Camera state is {_COHN_STATE_NAMES.get(status_response.state, '?')}, "
+                                f"but has IP ({status_response.ipaddress}), "
+                                f"considered configured"
+                            )
+                        logger.info(f"✅ COHN configuration complete! IP: {status_response.ipaddress}")
+                        return status_response
+
+                    await asyncio.sleep(interval)
+        except TimeoutError as e:
+            if not deadline.expired():
+                raise  # A single query timed out, not the overall wait
+            error_msg = (
+                f"COHN configuration timeout ({timeout} seconds)\n"
+                f"Possible causes:\n"
+                f"1. Router WiFi password incorrect\n"
+                f"2. WiFi signal too weak\n"
+                f"3. Router DHCP service abnormal\n"
+                f"Suggestion: Check network status on camera screen"
+            )
+            logger.error(error_msg)
+            raise TimeoutError(error_msg) from e
 
-    async def scan_wifi_networks(self, timeout: float | None = None) -> list[dict[str, Any]]:
+    async def scan_wifi_networks(
+        self, timeout: float | None = None, target_ssid: str | None = None
+    ) -> list[dict[str, Any]]:
         """Scan WiFi networks.
 
         Args:
@@ -706,153 +688,157 @@ class BleCommands:
                     - Normal scan usually completes within 3-5 seconds
                     - If camera is in STA mode (connected to WiFi), scan will fail
                     - Using shorter timeout can quickly detect failure and fall back to direct connect mode
+            target_ssid: Only look for this SSID, stops reading scan results once it is found
 
         Returns:
             List of WiFi networks, each containing ssid, signal_strength, flags, etc.
+            With target_ssid, the matching network only (empty list if not found).
 
         Raises:
             BleConnectionError: Scan failed
             TimeoutError: Scan timeout (possibly because camera is in STA mode)
         """
-        if timeout is None:
-            timeout = self._timeout.wifi_scan_timeout
+        networks = [network async for network in self.iter_wifi_networks(timeout, target_ssid)]
+        logger.info(f"✅ Scan complete, found {len(networks)} networks")
+        return networks
 
-        logger.info(f"📡 Starting WiFi network scan (camera {self.ble.target})...")
+    async def iter_wifi_networks(
+        self, timeout: float | None = None, target_ssid: str | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Scan WiFi networks, yielding each network as soon as its scan entry is received.
 
-        # Build and send scan request
-        request = network_proto.RequestStartScan()
-        command = self._build_protobuf_command(FeatureId.NETWORK_MANAGEMENT, ActionId.SCAN_WIFI_NETWORKS, request)
+        Scan entries are fetched from the camera in pages, so consumers can process (or stop at)
+        a network without waiting for the whole list.
 
-        # Clear response queue, prepare to receive notifications
-        self.ble.clear_response_queue()
+        Args:
+            timeout: Scan timeout (seconds), defaults to configured value
+            target_ssid: Only yield the network with this SSID, stops reading scan results once it is found
 
-        # Send scan command
-        logger.debug(f"Sending scan command: {command.hex(':')}")
-        await self.ble.write(GoProBleUUID.CM_NET_MGMT_COMM, command)
+        Yields:
+            WiFi network dict with ssid, signal_strength, signal_frequency and configured
 
-        # Wait for initial response (ResponseStartScanning)
-        initial_response_data = await self.ble.wait_for_response(timeout=self._timeout.ble_response_timeout)
-        if len(initial_response_data) < 2:
-            raise BleConnectionError("Invalid initial scan response")
+        Raises:
+            BleConnectionError: Scan failed
+            TimeoutError: Scan timeout (possibly because camera is in STA mode)
+        """
+        if timeout is None:
+            timeout = self._timeout.wifi_scan_timeout
 
-        # Parse initial response
-        initial_proto_data = initial_response_data[2:]
-        initial_response = network_proto.ResponseStartScanning()
-        initial_response.ParseFromString(initial_proto_data)
+        logger.info(f"📡 Starting WiFi network scan (camera {self.ble.target})...")
 
-        if initial_response.result != RESULT_SUCCESS:
-            error_msg = (
-                f"Failed to start scan: result={initial_response.result}. "
-                f"Possible cause: Camera is in STA mode (connected to router), WiFi chip is occupied. "
-                f"Solution: Manually disconnect WiFi on camera, or reset network settings."
+        command = _START_SCAN_COMMAND
+
+        # Subscribe before sending, so the scan complete notification can't slip past
+        with self.ble.subscribe_notifications(
+            FeatureId.NETWORK_MANAGEMENT, ActionId.NOTIF_START_SCAN
+        ) as scan_notifications:
+            # Send scan command and wait for initial response (ResponseStartScanning)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending scan command: %s", command.hex(":"))
+            initial_response = await self._send_raw_protobuf_command(
+                command,
+                network_proto.ResponseStartScanning,
+                GoProBleUUID.CM_NET_MGMT_COMM,
+                self._timeout.ble_response_timeout,
             )
-            raise BleConnectionError(error_msg)
 
-        logger.debug("Scan started, waiting for scan complete notification...")
+            if initial_response.result != RESULT_SUCCESS:
+                error_msg = (
+                    f"Failed to start scan: result={initial_response.result}. "
+                    f"Possible cause: Camera is in STA mode (connected to router), WiFi chip is occupied. "
+                    f"Solution: Manually disconnect WiFi on camera, or reset network settings."
+                )
+                raise BleConnectionError(error_msg)
+
+            logger.debug("Scan started, waiting for scan complete notification...")
 
-        # Wait for scan complete notification (NotifStartScanning)
-        scan_id = await self._wait_for_scan_complete(timeout=timeout)
+            # Wait for scan complete notification (NotifStartScanning)
+            scan_id, total_entries = await self._wait_for_scan_complete(scan_notifications, timeout=timeout)
 
-        # Get scan results
-        logger.debug(f"Scan complete, getting results (scan_id={scan_id})...")
+        # Get scan results, one page of entries per request
+        logger.debug("Scan complete, getting results (scan_id=%s)...", scan_id)
         get_entries_request = network_proto.RequestGetApEntries()
         get_entries_request.scan_id = scan_id
-        get_entries_request.start_index = 0
-        get_entries_request.max_entries = 100
-
-        response = await self._send_protobuf_command(
-            FeatureId.NETWORK_MANAGEMENT,
-            ActionId.GET_AP_ENTRIES,
-            get_entries_request,
-            network_proto.ResponseGetApEntries,
-            GoProBleUUID.CM_NET_MGMT_COMM,
-        )
+        get_entries_request.max_entries = _AP_ENTRIES_PAGE_SIZE if target_ssid is None else _AP_ENTRIES_TARGET_PAGE_SIZE
 
-        # Parse results
-        networks = []
-        for entry in response.entries:
-            networks.append({
-                "ssid": entry.ssid,
-                "signal_strength": entry.signal_strength_bars,
-                "signal_frequency": entry.signal_frequency_mhz,
-                "configured": bool(entry.scan_entry_flags & EnumScanEntryFlags.SCAN_FLAG_CONFIGURED),
-            })
+        start_index = 0
+        while start_index < total_entries:
+            get_entries_request.start_index = start_index
+            response = await self._send_protobuf_command(
+                FeatureId.NETWORK_MANAGEMENT,
+                ActionId.GET_AP_ENTRIES,
+                get_entries_request,
+                network_proto.ResponseGetApEntries,
+                GoProBleUUID.CM_NET_MGMT_COMM,
+            )
+            if not response.entries:
+                break
+            start_index += len(response.entries)
 
-        logger.info(f"✅ Scan complete, found {len(networks)} networks")
-        return networks
+            for entry in response.entries:
+                # Other networks are skipped before building their dict
+                if target_ssid is not None and entry.ssid != target_ssid:
+                    continue
+                yield {
+                    "ssid": entry.ssid,
+                    "signal_strength": entry.signal_strength_bars,
+                    "signal_frequency": entry.signal_frequency_mhz,
+                    "configured": bool(entry.scan_entry_flags & _SCAN_FLAG_CONFIGURED),
+                }
+                if target_ssid is not None:
+                    return
 
-    async def _wait_for_scan_complete(self, timeout: float) -> int:
+    async def _wait_for_scan_complete(self, notifications: asyncio.Queue[bytes], timeout: float) -> tuple[int, int]:
         """Wait for WiFi scan complete notification.
 
         Args:
+            notifications: NotifStartScanning subscription queue (see `BleConnectionManager.subscribe_notifications`)
             timeout: Timeout duration (seconds)
 
         Returns:
-            Scan ID
+            (scan_id, total_entries) of the completed scan
 
         Raises:
-            BleConnectionError: Scan failed or timeout
+            BleConnectionError: Scan failed
+            TimeoutError: Scan did not complete within timeout
         """
-        loop = asyncio.get_running_loop()
-        start_time = loop.time()
-
-        while True:
-            if loop.time() - start_time > timeout:
-                raise TimeoutError("WiFi scan complete timeout")
-
-            try:
-                # Wait for notification (NotifStartScanning)
-                notification_data = await self.ble.wait_for_response(timeout=self._timeout.ble_response_timeout)
-
-                if len(notification_data) < 2:
-                    logger.debug("Received invalid notification, continue waiting...")
-                    continue
+        # One message reused for every notification (ParseFromString clears it first)
+        notification = network_proto.NotifStartScanning()
+        try:
+            async with asyncio.timeout(timeout):
+                while True:
+                    # Wait for notification (NotifStartScanning), other responses never reach this queue
+                    notification_data = await notifications.get()
 
-                # Check if it's NotifStartScanning (NETWORK_MANAGEMENT + NOTIF_START_SCAN)
-                feature_id = notification_data[0]
-                action_id = notification_data[1]
+                    # Parse notification
+                    notification.ParseFromString(memoryview(notification_data)[2:])
 
-                if feature_id != FeatureId.NETWORK_MANAGEMENT or action_id != ActionId.NOTIF_START_SCAN:
                     logger.debug(
-                        f"Received other notification (feature={hex(feature_id)}, action={hex(action_id)}), continue waiting..."
+                        "Received scan notification: state=%s, scan_id=%s, total_entries=%s",
+                        notification.scanning_state,
+                        notification.scan_id,
+                        notification.total_entries,
                     )
-                    continue
-
-                # Parse notification
-                proto_data = notification_data[2:]
-                notification = network_proto.NotifStartScanning()
-                notification.ParseFromString(proto_data)
 
-                logger.debug(
-                    f"Received scan notification: state={notification.scanning_state}, "
-                    f"scan_id={notification.scan_id}, "
-                    f"total_entries={notification.total_entries}"
-                )
-
-                # Check scan status
-                if notification.scanning_state == EnumScanning.SCANNING_SUCCESS:
-                    logger.info(f"✅ Scan completed successfully! Found {notification.total_entries} networks")
-                    return notification.scan_id
-                elif notification.scanning_state == EnumScanning.SCANNING_STARTED:
-                    logger.debug("⏳ Scan in progress...")
-                    continue
-                elif notification.scanning_state in (
-                    EnumScanning.SCANNING_ABORTED_BY_SYSTEM,
-                    EnumScanning.SCANNING_CANCELLED_BY_USER,
-                ):
-                    raise BleConnectionError(f"Scan aborted: state={notification.scanning_state}")
-                else:  # Other states
-                    logger.debug(f"Received scan status update: {notification.scanning_state}")
-                    continue
-
-            except BleConnectionError:
-                # wait_for_response timeout, check overall timeout
-                if loop.time() - start_time > timeout:
-                    raise TimeoutError("WiFi scan complete timeout") from None
-                logger.debug("Waiting for scan notification timeout (5 seconds), continue waiting...")
-                continue
+                    # Check scan status
+                    if notification.scanning_state == EnumScanning.SCANNING_SUCCESS:
+                        logger.info(f"✅ Scan completed successfully! Found {notification.total_entries} networks")
+                        return notification.scan_id, notification.total_entries
+                    elif notification.scanning_state == EnumScanning.SCANNING_STARTED:
+                        logger.debug("⏳ Scan in progress...")
+                    elif notification.scanning_state in (
+                        EnumScanning.SCANNING_ABORTED_BY_SYSTEM,
+                        EnumScanning.SCANNING_CANCELLED_BY_USER,
+                    ):
+                        raise BleConnectionError(f"Scan aborted: state={notification.scanning_state}")
+                    else:  # Other states
+                        logger.debug("Received scan status update: %s", notification.scanning_state)
+        except TimeoutError as e:
+            raise TimeoutError("WiFi scan complete timeout") from e
 
-    async def _wait_for_provisioning_complete(self, ssid: str, timeout: float) -> None:
+    async def _wait_for_provisioning_complete(
+        self, ssid: str, notifications: asyncio.Queue[bytes], timeout: float
+    ) -> None:
         """Wait for WiFi configuration complete notification.
 
         Note: When switching WiFi in COHN mode, camera will disconnect BLE,
@@ -861,137 +847,66 @@ class BleCommands:
 
         Args:
             ssid: WiFi SSID (for logging)
+            notifications: NotifProvisioningState subscription queue
+                (see `BleConnectionManager.subscribe_notifications`)
             timeout: Timeout duration (seconds)
 
         Raises:
-            BleConnectionError: Connection failed (wrong password, etc.)
+            WifiProvisioningError: Connection failed (wrong password, etc.)
             TimeoutError: Timeout (possibly due to BLE disconnect)
         """
-        loop = asyncio.get_running_loop()
-        start_time = loop.time()
-        last_log_time = start_time
-
-        while True:
-            elapsed = loop.time() - start_time
-
-            if elapsed > timeout:
-                logger.warning(f"⚠️ WiFi '{ssid}' connection complete timeout ({timeout:.0f} seconds)")
-                raise TimeoutError(f"WiFi '{ssid}' connection complete timeout")
-
-            # Log waiting progress every 5 seconds
-            if elapsed - (last_log_time - start_time) >= 5:
-                logger.info(f"⏳ Waiting for WiFi connection... ({elapsed:.0f}s/{timeout:.0f}s)")
-                last_log_time = loop.time()
-
-            try:
-                # Wait for notification (NotifProvisioningState)
-                logger.debug("Waiting for NotifProvisioningState notification...")
-                notification_data = await self.ble.wait_for_response(timeout=self._timeout.ble_response_timeout)
-
-                if len(notification_data) < 2:
-                    logger.debug("Received invalid notification, continue waiting...")
-                    continue
-
-                # Check if it's NotifProvisioningState (Feature=0x02, Action=0x0C)
-                feature_id = notification_data[0]
-                action_id = notification_data[1]
+        # One message reused for every notification (ParseFromString clears it first)
+        notification = network_proto.NotifProvisioningState()
+        progress_task = asyncio.create_task(_log_wait_progress("⏳ Waiting for WiFi connection...", timeout))
 
-                logger.debug(
-                    f"Received notification: feature={hex(feature_id)}, "
-                    f"action={hex(action_id)}, "
-                    f"data length={len(notification_data)} bytes"
-                )
-
-                # Ignore WiFi scan notification (NOTIF_START_SCAN), this is camera's auto-scan before WiFi connection
-                if feature_id == FeatureId.NETWORK_MANAGEMENT and action_id == ActionId.NOTIF_START_SCAN:
-                    logger.debug(
-                        "⏭️ Received WiFi scan notification (NOTIF_START_SCAN), ignoring and continue waiting for config notification"
-                    )
-                    continue
-
-                # Only handle WiFi configuration notification (NOTIF_PROVIS_STATE)
-                if feature_id != FeatureId.NETWORK_MANAGEMENT or action_id != ActionId.NOTIF_PROVIS_STATE:
-                    logger.debug(
-                        f"⏭️ Received other notification (feature={hex(feature_id)}, action={hex(action_id)}), ignoring and continue waiting for config notification"
-                    )
-                    continue
-
-                # Parse notification
-                proto_data = notification_data[2:]
-                notification = network_proto.NotifProvisioningState()
-                notification.ParseFromString(proto_data)
-
-                logger.debug(f"Received config notification: state={notification.provisioning_state}")
-
-                state = notification.provisioning_state
-
-                # Success state: return immediately
-                if state in (
-                    EnumProvisioning.PROVISIONING_SUCCESS_NEW_AP,
-                    EnumProvisioning.PROVISIONING_SUCCESS_OLD_AP,
-                ):
-                    logger.info(
-                        f"✅ WiFi connection successful! Status: {state} "
-                        f"({'new network' if state == EnumProvisioning.PROVISIONING_SUCCESS_NEW_AP else 'configured network'})"
-                    )
-                    return
-
-                # In-progress state: continue waiting
-                if state == EnumProvisioning.PROVISIONING_STARTED:
-                    logger.debug("⏳ WiFi configuration in progress...")
-                    continue
-
-                # Error state: throw exception immediately (cannot be caught by except below)
-                if state in (
-                    EnumProvisioning.PROVISIONING_ABORTED_BY_SYSTEM,
-                    EnumProvisioning.PROVISIONING_CANCELLED_BY_USER,
-                    EnumProvisioning.PROVISIONING_ERROR_FAILED_TO_ASSOCIATE,
-                    EnumProvisioning.PROVISIONING_ERROR_PASSWORD_AUTH,
-                    EnumProvisioning.PROVISIONING_ERROR_EULA_BLOCKING,
-                    EnumProvisioning.PROVISIONING_ERROR_NO_INTERNET,
-                    EnumProvisioning.PROVISIONING_ERROR_UNSUPPORTED_TYPE,
-                ):
-                    error_messages = {
-                        EnumProvisioning.PROVISIONING_ABORTED_BY_SYSTEM: "Connection aborted by system",
-                        EnumProvisioning.PROVISIONING_CANCELLED_BY_USER: "Connection cancelled by user",
-                        EnumProvisioning.PROVISIONING_ERROR_FAILED_TO_ASSOCIATE: "Failed to associate to AP (signal too weak or AP unreachable)",
-                        EnumProvisioning.PROVISIONING_ERROR_PASSWORD_AUTH: "Password authentication failed (incorrect password)",
-                        EnumProvisioning.PROVISIONING_ERROR_EULA_BLOCKING: "EULA blocking (need to agree to user agreement)",
-                        EnumProvisioning.PROVISIONING_ERROR_NO_INTERNET: "No internet connection",
-                        EnumProvisioning.PROVISIONING_ERROR_UNSUPPORTED_TYPE: "Unsupported network type",
-                    }
-                    error_msg = error_messages.get(state, f"Unknown error (state={state})")
-                    logger.error(f"❌ WiFi connection failed: {error_msg}")
-
-                    # Create exception and mark as WiFi state error
-                    exc = BleConnectionError(
-                        f"WiFi '{ssid}' connection failed: {error_msg} (provisioning_state={state})"
-                    )
-                    exc._is_wifi_state_error = True  # type: ignore
-                    raise exc
-
-                # Other unknown states: log and continue waiting
-                logger.debug(f"⚠️ Received unknown provisioning state: {state}, continue waiting...")
-                continue
-
-            except BleConnectionError as e:
-                # Distinguish two types of BleConnectionError:
-                # 1. WiFi state error (actively thrown) -> fail immediately
-                # 2. wait_for_response timeout -> continue waiting
-
-                if hasattr(e, "_is_wifi_state_error") and e._is_wifi_state_error:
-                    # WiFi configuration failed, propagate immediately
-                    raise
-
-                # wait_for_response timeout, check overall timeout
-                if loop.time() - start_time > timeout:
-                    logger.warning(
-                        f"⚠️ WiFi '{ssid}' configuration notification timeout. In COHN mode camera may have disconnected BLE, this is normal"
-                    )
-                    raise TimeoutError(f"WiFi '{ssid}' connection complete timeout") from None
-
-                logger.debug("Waiting for config notification timeout (5 seconds), continue waiting...")
-                continue
+        try:
+            async with asyncio.timeout(timeout):
+                while True:
+                    # Wait for notification (NotifProvisioningState), other responses never reach this queue
+                    # (including the camera's auto-scan NOTIF_START_SCAN before WiFi connection)
+                    notification_data = await notifications.get()
+
+                    # Parse notification
+                    notification.ParseFromString(memoryview(notification_data)[2:])
+
+                    logger.debug("Received config notification: state=%s", notification.provisioning_state)
+
+                    state = notification.provisioning_state
+
+                    # Success state: return immediately
+                    if state in _PROVISIONING_SUCCESS_STATES:
+                        logger.info(
+                            f"✅ WiFi connection successful! Status: {state} "
+                            f"({'new network' if state == EnumProvisioning.PROVISIONING_SUCCESS_NEW_AP else 'configured network'})"
+                        )
+                        return
+
+                    # In-progress state: continue waiting
+                    if state == _PROVISIONING_STARTED:
+                        logger.debug("⏳ WiFi configuration in progress...")
+                        continue
+
+                    # Error state: throw exception immediately
+                    error_msg = _PROVISIONING_ERROR_MESSAGES.get(state)
+                    if error_msg is not None:
+                        logger.error(f"❌ WiFi connection failed: {error_msg}")
+
+                        raise WifiProvisioningError(
+                            f"WiFi '{ssid}' connection failed: {error_msg} (provisioning_state={state})", state
+                        )
+
+                    # Other unknown states: log and continue waiting
+                    logger.debug("⚠️ Received unknown provisioning state: %s, continue waiting...", state)
+        except TimeoutError:
+            logger.warning(
+                f"⚠️ WiFi '{ssid}' configuration notification timeout ({timeout:.0f} seconds). "
+                f"In COHN mode camera may have disconnected BLE, this is normal"
+            )
+            raise TimeoutError(f"WiFi '{ssid}' connection complete timeout") from None
+        finally:
+            progress_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await progress_task
 
     async def connect_to_wifi(
         self,
@@ -1049,7 +964,7 @@ class BleCommands:
         # Standard workflow: scan WiFi → check CONFIGURED flag → choose command
         logger.info(f"📡 [camera {self.ble.target}] Scanning WiFi networks...")
         try:
-            networks = await self.scan_wifi_networks(timeout=self._timeout.wifi_scan_internal_timeout)
+            networks = await self.scan_wifi_networks(timeout=self._timeout.wifi_scan_internal_timeout, target_ssid=ssid)
         except TimeoutError:
             logger.warning(
                 f"⚠️ [camera {self.ble.target}] WiFi scan timeout, camera may be in STA mode, trying RequestConnectNew directly"
@@ -1060,7 +975,7 @@ class BleCommands:
             return
 
         # Check if target SSID is configured
-        target_network = next((n for n in networks if n["ssid"] == ssid), None)
+        target_network = networks[0] if networks else None
         if not target_network:
             raise BleConnectionError(
                 f"WiFi '{ssid}' not found in scan results, please check:\n"
@@ -1077,7 +992,7 @@ class BleCommands:
 
         # Smart strategy:
         # 1. If configured → try RequestConnect first (fast, no password)
-        # 2. If failed (state=7, wrong password) → fallback to RequestConnectNew (with password, update saved password)
+        # 2. If failed (state=7/8, wrong password) → fallback to RequestConnectNew (with password, update saved password)
         # 3. If not configured → use RequestConnectNew directly
         if is_configured:
             logger.info(f"📤 [camera {self.ble.target}] WiFi configured, trying RequestConnect (fast mode)")
@@ -1085,9 +1000,9 @@ class BleCommands:
                 await self._connect_to_configured_wifi(ssid, timeout)
                 logger.info(f"✅ [camera {self.ble.target}] RequestConnect successful! Camera connected to '{ssid}'")
                 return
-            except BleConnectionError as e:
-                # Check if password error (state=7)
-                if "provisioning_state=7" in str(e):
+            except WifiProvisioningError as e:
+                # Check if password error (state=7/8), other provisioning failures are final
+                if e.provisioning_state in _STALE_CREDENTIAL_STATES:
                     logger.warning(
                         f"⚠️ [camera {self.ble.target}] RequestConnect failed (wrong password), "
                         f"fallback to RequestConnectNew to update password"
@@ -1112,67 +1027,11 @@ class BleCommands:
         Raises:
             BleConnectionError: Connection failed
         """
-        request = network_proto.RequestConnect()
-        request.ssid = ssid
-
-        command = self._build_protobuf_command(FeatureId.NETWORK_MANAGEMENT, ActionId.REQUEST_WIFI_CONNECT, request)
-
-        # Clear response queue
-        self.ble.clear_response_queue()
-
-        # Send connection command
         logger.info(f"📤 [camera {self.ble.target}] Sending RequestConnect command: ssid='{ssid}' (no password)")
-        await self.ble.write(GoProBleUUID.CM_NET_MGMT_COMM, command)
-
-        # Wait for initial response
-        logger.debug(f"[camera {self.ble.target}] Waiting for RequestConnect initial response...")
-        initial_response_data = await self.ble.wait_for_response(timeout=self._timeout.ble_response_timeout)
-        if len(initial_response_data) < 2:
-            raise BleConnectionError("RequestConnect initial response invalid (data too short)")
-
-        # Parse initial response
-        initial_proto_data = initial_response_data[2:]
-        initial_response = network_proto.ResponseConnect()
-        initial_response.ParseFromString(initial_proto_data)
-
-        # Check result
-        result_name = response_proto.EnumResultGeneric.Name(initial_response.result)
-        provisioning_state_name = network_proto.EnumProvisioning.Name(initial_response.provisioning_state)
-
-        logger.info(
-            f"📥 [camera {self.ble.target}] RequestConnect initial response: "
-            f"result={result_name} ({initial_response.result}), "
-            f"state={provisioning_state_name} ({initial_response.provisioning_state}), "
-            f"timeout={initial_response.timeout_seconds}s"
+        await self._send_wifi_connect(
+            ssid, _request_connect_command(ssid), "RequestConnect", network_proto.ResponseConnect, timeout
         )
 
-        if initial_response.result != RESULT_SUCCESS:
-            error_msg = (
-                f"RequestConnect start failed: "
-                f"result={result_name} ({initial_response.result}), "
-                f"state={provisioning_state_name} ({initial_response.provisioning_state})"
-            )
-            logger.error(f"❌ [camera {self.ble.target}] {error_msg}")
-            raise BleConnectionError(error_msg)
-
-        logger.info(
-            f"✅ [camera {self.ble.target}] RequestConnect command accepted by camera, "
-            f"initial state={provisioning_state_name}, expected timeout={initial_response.timeout_seconds}s"
-        )
-
-        # Wait for connection complete notification
-        logger.info(f"⏳ [camera {self.ble.target}] Waiting for WiFi connection complete (max {timeout}s)...")
-        try:
-            await self._wait_for_provisioning_complete(ssid, timeout=timeout)
-            logger.info(
-                f"✅ [camera {self.ble.target}] RequestConnect successful! WiFi connection confirmed via BLE notification: '{ssid}'"
-            )
-        except TimeoutError:
-            logger.warning(
-                f"⏱️ [camera {self.ble.target}] BLE notification timeout (camera may have disconnected BLE). "
-                f"Note: In COHN mode camera will disconnect BLE, this is normal behavior"
-            )
-
     async def _connect_to_new_wifi(self, ssid: str, password: str, timeout: float) -> None:
         """Connect to new WiFi network (using RequestConnectNew).
 
@@ -1191,65 +1050,85 @@ class BleCommands:
 
         command = self._build_protobuf_command(FeatureId.NETWORK_MANAGEMENT, ActionId.REQUEST_WIFI_CONNECT_NEW, request)
 
-        # Clear response queue
-        self.ble.clear_response_queue()
-
-        # Send connection command (note: don't log password)
+        # Note: don't log password
         logger.info(
             f"📤 [camera {self.ble.target}] Sending RequestConnectNew command: "
             f"ssid='{ssid}', password={'***' if password else '(empty)'}, "
             f"bypass_eula={request.bypass_eula_check}"
         )
-        await self.ble.write(GoProBleUUID.CM_NET_MGMT_COMM, command)
+        await self._send_wifi_connect(ssid, command, "RequestConnectNew", network_proto.ResponseConnectNew, timeout)
 
-        # Wait for initial response
-        logger.debug(f"[camera {self.ble.target}] Waiting for RequestConnectNew initial response...")
-        initial_response_data = await self.ble.wait_for_response(timeout=self._timeout.ble_response_timeout)
-        if len(initial_response_data) < 2:
-            raise BleConnectionError("RequestConnectNew initial response invalid (data too short)")
-
-        # Parse initial response
-        initial_proto_data = initial_response_data[2:]
-        initial_response = network_proto.ResponseConnectNew()
-        initial_response.ParseFromString(initial_proto_data)
+    async def _send_wifi_connect(
+        self, ssid: str, command: bytes, request_name: str, response_proto_class: Any, timeout: float
+    ) -> None:
+        """Send a WiFi connect request and wait for the camera to finish provisioning.
 
-        # Check result
-        result_name = response_proto.EnumResultGeneric.Name(initial_response.result)
-        provisioning_state_name = network_proto.EnumProvisioning.Name(initial_response.provisioning_state)
+        Shared by RequestConnect and RequestConnectNew, which only differ in request and response type.
 
-        logger.info(
-            f"📥 [camera {self.ble.target}] RequestConnectNew initial response: "
-            f"result={result_name} ({initial_response.result}), "
-            f"state={provisioning_state_name} ({initial_response.provisioning_state}), "
-            f"timeout={initial_response.timeout_seconds}s"
-        )
+        Args:
+            ssid: WiFi SSID (for logging)
+            command: Serialized connect command
+            request_name: Request name for log and error messages
+            response_proto_class: Initial response protobuf class
+            timeout: Connection timeout (seconds)
 
-        if initial_response.result != RESULT_SUCCESS:
-            error_msg = (
-                f"RequestConnectNew start failed: "
-                f"result={result_name} ({initial_response.result}), "
-                f"state={provisioning_state_name} ({initial_response.provisioning_state})"
+        Raises:
+            BleConnectionError: Camera rejected the request
+            WifiProvisioningError: Connection failed (wrong password, etc.)
+        """
+        # Subscribe before sending, so no provisioning state notification can slip past
+        with self.ble.subscribe_notifications(
+            FeatureId.NETWORK_MANAGEMENT, ActionId.NOTIF_PROVIS_STATE
+        ) as provisioning_notifications:
+            # Send connection command and wait for initial response
+            initial_response = await self._send_raw_protobuf_command(
+                command,
+                response_proto_class,
+                GoProBleUUID.CM_NET_MGMT_COMM,
+                self._timeout.ble_response_timeout,
             )
-            logger.error(f"❌ [camera {self.ble.target}] {error_msg}")
-            raise BleConnectionError(error_msg)
 
-        logger.info(
-            f"✅ [camera {self.ble.target}] RequestConnectNew command accepted by camera, "
-            f"initial state={provisioning_state_name}, expected timeout={initial_response.timeout_seconds}s"
-        )
+            # Check result
+            result_name = _RESULT_NAMES.get(initial_response.result, str(initial_response.result))
+            provisioning_state_name = _PROVISIONING_NAMES.get(
+                initial_response.provisioning_state, str(initial_response.provisioning_state)
+            )
 
-        # Wait for connection complete notification
-        logger.info(f"⏳ [camera {self.ble.target}] Waiting for WiFi connection complete (max {timeout}s)...")
-        try:
-            await self._wait_for_provisioning_complete(ssid, timeout=timeout)
             logger.info(
-                f"✅ [camera {self.ble.target}] RequestConnectNew successful! WiFi connection confirmed via BLE notification: '{ssid}'"
+                f"📥 [camera {self.ble.target}] {request_name} initial response: "
+                f"result={result_name} ({initial_response.result}), "
+                f"state={provisioning_state_name} ({initial_response.provisioning_state}), "
+                f"timeout={initial_response.timeout_seconds}s"
             )
-        except TimeoutError:
+
+            if initial_response.result != RESULT_SUCCESS:
+                error_msg = (
+                    f"{request_name} start failed: "
+                    f"result={result_name} ({initial_response.result}), "
+                    f"state={provisioning_state_name} ({initial_response.provisioning_state})"
+                )
+                logger.error(f"❌ [camera {self.ble.target}] {error_msg}")
+                raise BleConnectionError(error_msg)
+
             logger.info(
-                f"⏱️ BLE notification timeout (camera may have disconnected BLE), will verify WiFi connection status via HTTP: {ssid}"
+                f"✅ [camera {self.ble.target}] {request_name} command accepted by camera, "
+                f"initial state={provisioning_state_name}, expected timeout={initial_response.timeout_seconds}s"
             )
 
+            # Wait for connection complete notification
+            logger.info(f"⏳ [camera {self.ble.target}] Waiting for WiFi connection complete (max {timeout}s)...")
+            try:
+                await self._wait_for_provisioning_complete(ssid, provisioning_notifications, timeout=timeout)
+                logger.info(
+                    f"✅ [camera {self.ble.target}] {request_name} successful! "
+                    f"WiFi connection confirmed via BLE notification: '{ssid}'"
+                )
+            except TimeoutError:
+                logger.warning(
+                    f"⏱️ [camera {self.ble.target}] BLE notification timeout (camera may have disconnected BLE). "
+                    f"Note: In COHN mode camera will disconnect BLE, this is normal behavior"
+                )
+
     async def enable_wifi_ap(self, enable: bool) -> None:
         """Enable/disable WiFi access point.
 
@@ -11,16 +11,40 @@ from __future__ import annotations
 
 __all__ = ["HttpCommands"]
 
+import asyncio
+import contextlib
+import functools
+import json
 import logging
+import random
 from datetime import datetime
 from typing import Any
+from urllib.parse import urlencode
 
 from ..connection.http_manager import HttpConnectionManager
 from ..exceptions import HttpConnectionError
-from .base import with_http_retry
+from .base import CircuitBreaker, _check_response, with_http_retry
 
 logger = logging.getLogger(__name__)
 
+# In-flight requests per batch settings call, low enough not to overwhelm the camera HTTP server
+_SETTINGS_BATCH_CONCURRENCY = 4
+
+# Background keep-alive backoff after failed signals: interval * 2^failures, capped (seconds)
+_KEEP_ALIVE_MAX_BACKOFF = 30.0
+
+# Start/stop endpoints, selected by the enable flag instead of formatted per call
+_SHUTTER_START_ENDPOINT = "gopro/camera/shutter/start"
+_SHUTTER_STOP_ENDPOINT = "gopro/camera/shutter/stop"
+_PREVIEW_STREAM_START_ENDPOINT = "gopro/camera/stream/start"
+_PREVIEW_STREAM_STOP_ENDPOINT = "gopro/camera/stream/stop"
+
+
+@functools.lru_cache(maxsize=256)
+def _with_query(endpoint: str, *params: tuple[str, int]) -> str:
+    """Build an endpoint with its query string, cached so repeated settings requests skip the encoding."""
+    return f"{endpoint}?{urlencode(params)}"
+
 
 class HttpCommands:
     """HTTP command interface.
@@ -36,6 +60,13 @@ class HttpCommands:
         """
         self.http = http_manager
         self._http_error_count = 0  # HTTP error count (used by retry decorator)
+        self._http_breaker = CircuitBreaker()  # Fail fast while the camera HTTP endpoint is down
+        # Shared backoff of concurrent retries (resolves to the shared retry's error, None on success)
+        self._http_retry_gate: asyncio.Future[HttpConnectionError | None] | None = None
+        self._keep_alive_task: asyncio.Task[None] | None = None  # Background keep-alive (start_keep_alive)
+        # Raw body of the last camera state and its ETag, reused by get_camera_state on 304 Not Modified
+        self._state_body: bytes | None = None
+        self._state_etag: str | None = None
 
     # ==================== Recording Control ====================
 
@@ -49,14 +80,11 @@ class HttpCommands:
         Raises:
             HttpConnectionError: Command failed
         """
-        mode = "start" if enable else "stop"
         logger.info(f"{'Starting' if enable else 'Stopping'} recording on camera {self.http.target}...")
 
-        endpoint = f"gopro/camera/shutter/{mode}"
+        endpoint = _SHUTTER_START_ENDPOINT if enable else _SHUTTER_STOP_ENDPOINT
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to control shutter (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to control shutter")
 
         logger.info(f"✅ Camera {self.http.target} recording {'started' if enable else 'stopped'}")
 
@@ -71,16 +99,13 @@ class HttpCommands:
         Raises:
             HttpConnectionError: Command failed
         """
-        mode = "start" if enable else "stop"
         logger.info(f"{'Starting' if enable else 'Stopping'} preview stream on camera {self.http.target}...")
 
-        endpoint = f"gopro/camera/stream/{mode}"
+        endpoint = _PREVIEW_STREAM_START_ENDPOINT if enable else _PREVIEW_STREAM_STOP_ENDPOINT
         params = {"port": str(port)} if (enable and port) else None
 
         async with self.http.get(endpoint, params=params) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to control preview stream (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to control preview stream")
 
         logger.info(f"✅ Camera {self.http.target} preview stream {'started' if enable else 'stopped'}")
 
@@ -95,9 +120,7 @@ class HttpCommands:
 
         endpoint = "gopro/media/hilight/moment"
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to tag highlight (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to tag highlight")
 
         logger.info(f"✅ Camera {self.http.target} highlight tagged")
 
@@ -107,8 +130,11 @@ class HttpCommands:
     async def get_camera_state(self) -> dict[str, Any]:
         """Get complete camera state (including all settings and status).
 
+        If the camera sends an ETag, polls of an unchanged state are answered with `304 Not Modified`
+        and decoded from the cached body of the previous response, skipping the transfer.
+
         Returns:
-            Status dictionary
+            Status dictionary (decoded per call, the caller may modify it)
 
         Raises:
             HttpConnectionError: Command failed
@@ -116,12 +142,19 @@ class HttpCommands:
         logger.debug("Getting camera state...")
 
         endpoint = "gopro/camera/state"
-        async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to get state (HTTP {resp.status}): {text}")
+        headers = {"If-None-Match": self._state_etag} if self._state_etag and self._state_body is not None else None
+        async with self.http.get(endpoint, headers=headers) as resp:
+            if resp.status == 304 and self._state_body is not None:
+                logger.debug("Camera state not modified")
+                return json.loads(self._state_body)
 
-            state = await resp.json()
+            await _check_response(resp, "Failed to get state")
+
+            body = await resp.read()
+            self._state_body, self._state_etag = body, resp.headers.get("ETag")
+
+            # Decode the raw body directly, skipping aiohttp's strip + charset decode copies of a large payload
+            state = json.loads(body)
             logger.debug("Camera state retrieved successfully")
             return state
 
@@ -135,13 +168,11 @@ class HttpCommands:
         Raises:
             HttpConnectionError: Command failed
         """
-        logger.debug(f"Getting camera {self.http.target} information...")
+        logger.debug("Getting camera %s information...", self.http.target)
 
         endpoint = "gopro/camera/info"
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to get information (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to get information")
 
             info = await resp.json()
             return info
@@ -153,13 +184,58 @@ class HttpCommands:
         Raises:
             HttpConnectionError: Command failed
         """
-        logger.debug(f"Sending keep-alive signal (camera {self.http.target})...")
+        await self._send_keep_alive()
+
+    async def _send_keep_alive(self) -> None:
+        """Send one keep-alive signal (no retry)."""
+        logger.debug("Sending keep-alive signal (camera %s)...", self.http.target)
 
         endpoint = "gopro/camera/keep_alive"
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Keep-alive failed (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Keep-alive failed")
+
+    async def start_keep_alive(self, interval: float = 3.0) -> None:
+        """Start sending keep-alive signals in the background.
+
+        Signals are sent every `interval` seconds (jittered by ±25%). A failed signal is not retried
+        immediately: the next one waits with exponential backoff instead, so several cameras or
+        callers never retry against the camera in lockstep. Calling again restarts the task.
+
+        Args:
+            interval: Time between keep-alive signals (seconds)
+        """
+        await self.stop_keep_alive()
+        self._keep_alive_task = asyncio.create_task(self._keep_alive_loop(interval))
+        logger.info(f"💓 Background keep-alive started (camera {self.http.target}, every {interval:g}s)")
+
+    async def stop_keep_alive(self) -> None:
+        """Stop the background keep-alive task (no-op if not running)."""
+        task, self._keep_alive_task = self._keep_alive_task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        logger.info(f"Background keep-alive stopped (camera {self.http.target})")
+
+    async def _keep_alive_loop(self, interval: float) -> None:
+        """Send keep-alive signals until cancelled, backing off after failures.
+
+        Args:
+            interval: Time between keep-alive signals (seconds)
+        """
+        failures = 0
+        while True:
+            try:
+                await self._send_keep_alive()
+            except HttpConnectionError as e:
+                failures += 1
+                delay = min(_KEEP_ALIVE_MAX_BACKOFF, interval * (1 << failures)) * random.uniform(1.0, 1.5)  # noqa: S311
+                logger.warning("Keep-alive failed (%d in a row), next attempt in %.1fs: %s", failures, delay, e)
+            else:
+                failures = 0
+                delay = interval * random.uniform(0.75, 1.25)  # noqa: S311
+            await asyncio.sleep(delay)
 
     # ==================== Date and Time ====================
 
@@ -189,9 +265,7 @@ class HttpCommands:
         }
 
         async with self.http.get(endpoint, params=params) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to set time (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to set time")
 
         logger.info(f"✅ Camera {self.http.target} time set")
 
@@ -205,13 +279,11 @@ class HttpCommands:
         Raises:
             HttpConnectionError: Command failed
         """
-        logger.debug(f"Getting camera {self.http.target} time...")
+        logger.debug("Getting camera %s time...", self.http.target)
 
         endpoint = "gopro/camera/get_date_time"
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to get time (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to get time")
 
             # Parse time data (adjust according to actual return format)
             # Simplified handling here, may require more complex parsing in practice
@@ -233,19 +305,15 @@ class HttpCommands:
         Raises:
             HttpConnectionError: Command failed
         """
-        logger.debug(f"Getting setting ID {setting_id} (camera {self.http.target})...")
+        logger.debug("Getting setting ID %s (camera %s)...", setting_id, self.http.target)
 
         endpoint = "gopro/camera/setting"
-        params = {"setting": str(setting_id)}
-
-        async with self.http.get(endpoint, params=params) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to get setting (HTTP {resp.status}): {text}")
+        async with self.http.get(_with_query(endpoint, ("setting", setting_id))) as resp:
+            await _check_response(resp, "Failed to get setting")
 
             data = await resp.json()
             value = data.get("setting", {}).get("value")
-            logger.debug(f"Setting {setting_id} = {value}")
+            logger.debug("Setting %s = %s", setting_id, value)
             return value
 
     @with_http_retry(max_retries=2)
@@ -262,15 +330,57 @@ class HttpCommands:
         logger.info(f"Setting ID {setting_id} = {value} (camera {self.http.target})...")
 
         endpoint = "gopro/camera/setting/set"
-        params = {"setting": str(setting_id), "option": str(value)}
-
-        async with self.http.get(endpoint, params=params) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to modify setting (HTTP {resp.status}): {text}")
+        async with self.http.get(_with_query(endpoint, ("setting", setting_id), ("option", value))) as resp:
+            await _check_response(resp, "Failed to modify setting")
 
         logger.info(f"✅ Setting modified successfully: {setting_id} = {value}")
 
+    async def get_settings(
+        self, setting_ids: list[int], max_concurrent: int = _SETTINGS_BATCH_CONCURRENCY
+    ) -> dict[int, Any]:
+        """Get values of multiple settings concurrently.
+
+        Each request is retried by `get_setting` itself, so the batch is not wrapped in another retry.
+
+        Args:
+            setting_ids: Setting IDs
+            max_concurrent: Maximum requests in flight at once
+
+        Returns:
+            Dictionary of setting ID -> setting value
+
+        Raises:
+            HttpConnectionError: Command failed
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def get_one(setting_id: int) -> tuple[int, Any]:
+            async with semaphore:
+                return setting_id, await self.get_setting(setting_id)
+
+        return dict(await asyncio.gather(*(get_one(setting_id) for setting_id in setting_ids)))
+
+    async def set_settings(self, settings: dict[int, int], max_concurrent: int = _SETTINGS_BATCH_CONCURRENCY) -> None:
+        """Modify multiple settings concurrently.
+
+        Requests are not ordered, so settings that depend on each other (e.g. resolution and
+        frame rate) should be set with separate calls.
+
+        Args:
+            settings: Dictionary of setting ID -> setting value
+            max_concurrent: Maximum requests in flight at once
+
+        Raises:
+            HttpConnectionError: Command failed
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def set_one(setting_id: int, value: int) -> None:
+            async with semaphore:
+                await self.set_setting(setting_id, value)
+
+        await asyncio.gather(*(set_one(setting_id, value) for setting_id, value in settings.items()))
+
     # ==================== Preset Management ====================
 
     @with_http_retry(max_retries=2)
@@ -286,15 +396,11 @@ class HttpCommands:
         Raises:
             HttpConnectionError: Command failed
         """
-        logger.debug(f"Getting preset status (camera {self.http.target})...")
+        logger.debug("Getting preset status (camera %s)...", self.http.target)
 
         endpoint = "gopro/camera/presets/get"
-        params = {"include-hidden": "1" if include_hidden else "0"}
-
-        async with self.http.get(endpoint, params=params) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to get presets (HTTP {resp.status}): {text}")
+        async with self.http.get(_with_query(endpoint, ("include-hidden", int(include_hidden)))) as resp:
+            await _check_response(resp, "Failed to get presets")
 
             return await resp.json()
 
@@ -311,12 +417,8 @@ class HttpCommands:
         logger.info(f"Loading preset {preset_id} (camera {self.http.target})...")
 
         endpoint = "gopro/camera/presets/load"
-        params = {"id": str(preset_id)}
-
-        async with self.http.get(endpoint, params=params) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to load preset (HTTP {resp.status}): {text}")
+        async with self.http.get(_with_query(endpoint, ("id", preset_id))) as resp:
+            await _check_response(resp, "Failed to load preset")
 
         logger.info(f"✅ Preset {preset_id} loaded")
 
@@ -333,12 +435,8 @@ class HttpCommands:
         logger.info(f"Loading preset group {group_id} (camera {self.http.target})...")
 
         endpoint = "gopro/camera/presets/set_group"
-        params = {"id": str(group_id)}
-
-        async with self.http.get(endpoint, params=params) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to load preset group (HTTP {resp.status}): {text}")
+        async with self.http.get(_with_query(endpoint, ("id", group_id))) as resp:
+            await _check_response(resp, "Failed to load preset group")
 
         logger.info(f"✅ Preset group {group_id} loaded")
 
@@ -360,12 +458,8 @@ class HttpCommands:
         logger.info(f"Setting digital zoom to {percent}% (camera {self.http.target})...")
 
         endpoint = "gopro/camera/digital_zoom"
-        params = {"percent": str(percent)}
-
-        async with self.http.get(endpoint, params=params) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to set zoom (HTTP {resp.status}): {text}")
+        async with self.http.get(_with_query(endpoint, ("percent", percent))) as resp:
+            await _check_response(resp, "Failed to set zoom")
 
         logger.info(f"✅ Digital zoom set to {percent}%")
 
@@ -380,8 +474,6 @@ class HttpCommands:
 
         endpoint = "gp/gpControl/command/system/reset"
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Reboot failed (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Reboot failed")
 
         logger.info(f"✅ Camera {self.http.target} is rebooting")
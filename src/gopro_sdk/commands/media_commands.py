@@ -7,9 +7,13 @@ from __future__ import annotations
 
 __all__ = ["MediaCommands", "MediaFile"]
 
+import asyncio
+import functools
+import json
 import logging
+import operator
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -18,12 +22,15 @@ from open_gopro.models.media_list import MediaList
 
 from ..connection.http_manager import HttpConnectionManager
 from ..exceptions import HttpConnectionError
-from .base import with_http_retry
+from .base import CircuitBreaker, _check_response, with_http_retry
 
 logger = logging.getLogger(__name__)
 
+# Concurrent downloads per batch, more than this saturates the camera's WiFi stack without gaining throughput
+_DOWNLOAD_CONCURRENCY = 3
 
-@dataclass
+
+@dataclass(slots=True)
 class MediaFile:
     """Media file information.
 
@@ -35,11 +42,19 @@ class MediaFile:
     creation_timestamp: str  # Creation time (Unix timestamp string, UTC)
     modified_time: str  # Modified time (Unix timestamp string, UTC)
     size: int = 0  # File size (bytes), default 0 (requires additional query or obtained from download response)
+    # creation_timestamp parsed on first access, and again only if it was reassigned since
+    _parsed_timestamp: str | None = field(default=None, init=False, repr=False, compare=False)
+    _created_time: int = field(default=0, init=False, repr=False, compare=False)
+    _created_datetime: datetime | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def created_time(self) -> int:
         """Compatibility property: returns creation time as int (UTC timestamp)."""
-        return int(self.creation_timestamp)
+        if self._parsed_timestamp != self.creation_timestamp:
+            self._created_time = int(self.creation_timestamp)
+            self._created_datetime = None
+            self._parsed_timestamp = self.creation_timestamp
+        return self._created_time
 
     @property
     def created_datetime(self) -> datetime:
@@ -60,9 +75,12 @@ class MediaFile:
         Returns:
             datetime object in local timezone
         """
-        # Temporary workaround: subtract 8-hour offset (28800 seconds = 8 * 3600) to compensate for firmware issue
-        adjusted_timestamp = self.created_time - 28800
-        return datetime.fromtimestamp(adjusted_timestamp)
+        # Computed on first access only, list views re-read it on every render
+        created_time = self.created_time  # Drops the cached datetime if creation_timestamp changed
+        if self._created_datetime is None:
+            # Temporary workaround: subtract 8-hour offset (28800 seconds = 8 * 3600) to compensate for firmware issue
+            self._created_datetime = datetime.fromtimestamp(created_time - 28800)
+        return self._created_datetime
 
 
 class MediaCommands:
@@ -76,6 +94,9 @@ class MediaCommands:
         """
         self.http = http_manager
         self._http_error_count = 0  # HTTP error count (used by retry decorator)
+        self._http_breaker = CircuitBreaker()  # Fail fast while the camera HTTP endpoint is down
+        # Shared backoff of concurrent retries (resolves to the shared retry's error, None on success)
+        self._http_retry_gate: asyncio.Future[HttpConnectionError | None] | None = None
 
     @with_http_retry(max_retries=3)
     async def get_media_list(self) -> list[MediaFile]:
@@ -93,11 +114,10 @@ class MediaCommands:
 
         endpoint = "gopro/media/list"
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to list media (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to list media")
 
-            data = await resp.json()
+            # Decode the raw body directly, skipping aiohttp's strip + charset decode copies of a large payload
+            data = json.loads(await resp.read())
 
             # Parse media list using the Open GoPro SDK
             media_list = MediaList(**data)
@@ -114,7 +134,7 @@ class MediaCommands:
             ]
 
             # Sort by creation time descending (newest files first)
-            media_files.sort(key=lambda f: int(f.creation_timestamp), reverse=True)
+            media_files.sort(key=operator.attrgetter("created_time"), reverse=True)
 
             logger.info(f"✅ Found {len(media_files)} media files")
             return media_files
@@ -151,6 +171,62 @@ class MediaCommands:
         logger.info(f"✅ File download complete: {save_path} ({downloaded} bytes)")
         return downloaded
 
+    async def download_files(
+        self,
+        media_files: list[MediaFile | str],
+        directory: str | Path,
+        concurrency: int = _DOWNLOAD_CONCURRENCY,
+        progress_callback: Callable[[str, int, int], None] | None = None,
+        use_turbo: bool = True,
+    ) -> list[int | BaseException]:
+        """Download multiple media files concurrently into one directory.
+
+        Files keep their camera filename (without the DCIM subdirectory). A failed download does not
+        cancel the others, its exception is returned in place of the byte count.
+
+        Args:
+            media_files: MediaFile objects or file paths (e.g., "100GOPRO/GX010001.MP4")
+            directory: Destination directory (created if missing)
+            concurrency: Maximum downloads in flight at once
+            progress_callback: Progress callback function (file_path: str, downloaded: int, total: int) -> None
+            use_turbo: Enable Turbo transfer mode for the duration of the batch
+
+        Returns:
+            Number of bytes downloaded (or the raised exception) per file, in input order
+
+        Raises:
+            ValueError: concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def download_one(media_file: MediaFile | str) -> int:
+            file_path = media_file.filename if isinstance(media_file, MediaFile) else media_file
+            callback = functools.partial(progress_callback, file_path) if progress_callback else None
+            async with semaphore:
+                return await self.download_file(file_path, directory / Path(file_path).name, callback)
+
+        logger.info(f"⬇️ Downloading {len(media_files)} files to {directory} ({concurrency} at a time)...")
+
+        if use_turbo:
+            await self.set_turbo_mode(True)
+        try:
+            results = await asyncio.gather(*(download_one(m) for m in media_files), return_exceptions=True)
+        finally:
+            if use_turbo:
+                try:
+                    await self.set_turbo_mode(False)
+                except HttpConnectionError as e:
+                    logger.warning(f"⚠️ Failed to disable Turbo mode after downloads: {e}")
+
+        failed = sum(isinstance(r, BaseException) for r in results)
+        logger.info(f"✅ Batch download complete: {len(results) - failed} succeeded, {failed} failed")
+        return results
+
     @with_http_retry(max_retries=3)
     async def delete_file(self, path: str) -> None:
         """Delete single media file.
@@ -167,9 +243,7 @@ class MediaCommands:
         params = {"path": path}
 
         async with self.http.get(endpoint, params=params) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to delete file (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to delete file")
 
         logger.info(f"✅ File deleted successfully: {path}")
 
@@ -184,9 +258,7 @@ class MediaCommands:
 
         endpoint = "gp/gpControl/command/storage/delete/all"
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to delete all media (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to delete all media")
 
         logger.info("✅ All media files deleted")
 
@@ -203,15 +275,13 @@ class MediaCommands:
         Raises:
             HttpConnectionError: Command failed
         """
-        logger.debug(f"📄 Getting file metadata: {path}...")
+        logger.debug("📄 Getting file metadata: %s...", path)
 
         endpoint = "gopro/media/info"
         params = {"path": path}
 
         async with self.http.get(endpoint, params=params) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to get metadata (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to get metadata")
 
             return await resp.json()
 
@@ -225,13 +295,11 @@ class MediaCommands:
         Raises:
             HttpConnectionError: Command failed
         """
-        logger.debug(f"Getting last captured media (camera {self.http.target})...")
+        logger.debug("Getting last captured media (camera %s)...", self.http.target)
 
         endpoint = "gopro/media/last_captured"
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to get last media (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to get last media")
 
             return await resp.json()
 
@@ -251,8 +319,6 @@ class MediaCommands:
         params = {"p": "1" if enable else "0"}
 
         async with self.http.get(endpoint, params=params) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to set Turbo mode (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to set Turbo mode")
 
         logger.info(f"✅ Turbo mode {'enabled' if enable else 'disabled'}")
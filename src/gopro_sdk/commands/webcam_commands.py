@@ -11,12 +11,13 @@ from __future__ import annotations
 
 __all__ = ["WebcamCommands"]
 
+import asyncio
 import logging
 from typing import Any
 
 from ..connection.http_manager import HttpConnectionManager
 from ..exceptions import HttpConnectionError
-from .base import with_http_retry
+from .base import CircuitBreaker, _check_response, with_http_retry
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,9 @@ class WebcamCommands:
         """
         self.http = http_manager
         self._http_error_count = 0  # HTTP error counter (for retry decorator)
+        self._http_breaker = CircuitBreaker()  # Fail fast while the camera HTTP endpoint is down
+        # Shared backoff of concurrent retries (resolves to the shared retry's error, None on success)
+        self._http_retry_gate: asyncio.Future[HttpConnectionError | None] | None = None
 
     @with_http_retry(max_retries=3)
     async def webcam_start(
@@ -58,20 +62,14 @@ class WebcamCommands:
         logger.info(f"📹 Starting Webcam mode (camera {self.http.target})...")
 
         endpoint = "gopro/webcam/start"
-        params = {}
-        if resolution is not None:
-            params["res"] = str(resolution)
-        if fov is not None:
-            params["fov"] = str(fov)
-        if port is not None:
-            params["port"] = str(port)
-        if protocol is not None:
-            params["protocol"] = protocol
+        params = {
+            key: str(value)
+            for key, value in (("res", resolution), ("fov", fov), ("port", port), ("protocol", protocol))
+            if value is not None
+        }
 
         async with self.http.get(endpoint, params=params or None) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to start Webcam (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to start Webcam")
 
             result = await resp.json()
             logger.info("✅ Webcam mode started")
@@ -91,9 +89,7 @@ class WebcamCommands:
 
         endpoint = "gopro/webcam/stop"
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to stop Webcam (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to stop Webcam")
 
             result = await resp.json()
             logger.info("✅ Webcam mode stopped")
@@ -109,13 +105,11 @@ class WebcamCommands:
         Raises:
             HttpConnectionError: Command failed
         """
-        logger.debug(f"📊 Getting Webcam status (camera {self.http.target})...")
+        logger.debug("📊 Getting Webcam status (camera %s)...", self.http.target)
 
         endpoint = "gopro/webcam/status"
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to get Webcam status (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to get Webcam status")
 
             return await resp.json()
 
@@ -133,9 +127,7 @@ class WebcamCommands:
 
         endpoint = "gopro/webcam/preview"
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to start preview (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to start preview")
 
             result = await resp.json()
             logger.info("✅ Webcam preview started")
@@ -155,9 +147,7 @@ class WebcamCommands:
 
         endpoint = "gopro/webcam/exit"
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to exit Webcam (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to exit Webcam")
 
             result = await resp.json()
             logger.info("✅ Exited Webcam mode")
@@ -173,13 +163,11 @@ class WebcamCommands:
         Raises:
             HttpConnectionError: Command failed
         """
-        logger.debug(f"Getting Webcam version (camera {self.http.target})...")
+        logger.debug("Getting Webcam version (camera %s)...", self.http.target)
 
         endpoint = "gopro/webcam/version"
         async with self.http.get(endpoint) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise HttpConnectionError(f"Failed to get version (HTTP {resp.status}): {text}")
+            await _check_response(resp, "Failed to get version")
 
             data = await resp.json()
             return data.get("version", "unknown")
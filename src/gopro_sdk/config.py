@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
-__all__ = ["CohnConfigManager", "CohnCredentials", "TimeoutConfig"]
+__all__ = ["DEFAULT_TIMEOUT_CONFIG", "CohnConfigManager", "CohnCredentials", "TimeoutConfig"]
 
 import contextlib
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, cast
 
 from tinydb import Query, TinyDB
+from tinydb.storages import JSONStorage
+from tinydb.table import Document
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CohnCredentials:
     """COHN credentials information.
 
+    Instances are immutable, since `CohnConfigManager` hands out cached instances.
+    Use `dataclasses.replace()` to derive updated credentials (e.g. a new IP address).
+
     Attributes:
         ip_address: IP address assigned by camera
         username: HTTP authentication username
@@ -50,11 +57,12 @@ class CohnCredentials:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeoutConfig:
     """Timeout configuration.
 
     Reference design document question 13, all timeout values are configurable.
+    Instances are immutable (and hashable), use `dataclasses.replace()` to derive a modified copy.
     """
 
     # BLE related timeouts
@@ -102,6 +110,51 @@ class TimeoutConfig:
     preview_state_settle_delay: float = 0.2  # Delay for camera state to settle before starting preview
 
 
+# Shared by all components created without an explicit timeout configuration
+DEFAULT_TIMEOUT_CONFIG = TimeoutConfig()
+
+
+# Query path of the serial field, built once instead of per lookup
+_serial_field = Query().serial
+
+
+class _CachingJSONStorage(JSONStorage):
+    """JSON storage that reuses the parsed database while the file is unchanged on disk.
+
+    TinyDB's JSONStorage re-reads and parses the whole file on every operation. Here the file's
+    (mtime, size) is checked instead, so writes by another manager or process are still picked up.
+    Writes go straight to disk as before (no write batching), so saved credentials are never lost.
+
+    Attributes:
+        generation: Incremented whenever the data changes (write or re-read), for caches built on top
+    """
+
+    def __init__(self, path: str, **kwargs: Any) -> None:
+        super().__init__(path, **kwargs)
+        self._cache: dict[str, dict[str, Any]] | None = None
+        self._signature: tuple[int, int] | None = None
+        self.generation = 0
+
+    def _file_signature(self) -> tuple[int, int]:
+        stat = os.fstat(self._handle.fileno())
+        return stat.st_mtime_ns, stat.st_size
+
+    def read(self) -> dict[str, dict[str, Any]] | None:
+        signature = self._file_signature()
+        if signature != self._signature:
+            self._cache = super().read()
+            self._signature = signature
+            self.generation += 1
+        return self._cache
+
+    def write(self, data: dict[str, dict[str, Any]]) -> None:
+        # Drop the cache first so a failed write is re-read from disk
+        self._signature = None
+        super().write(data)
+        self._cache, self._signature = data, self._file_signature()
+        self.generation += 1
+
+
 class CohnConfigManager:
     """COHN configuration persistence manager.
 
@@ -123,8 +176,14 @@ class CohnConfigManager:
             db_path = Path("cohn_credentials.json")
 
         self._db_path = db_path
-        self._db = TinyDB(str(db_path))
+        self._db = TinyDB(str(db_path), storage=_CachingJSONStorage)
+        self._storage = cast("_CachingJSONStorage", self._db.storage)
         self._table = self._db.table("credentials")
+        # serial -> document ID, so lookups by serial skip TinyDB's full-table scan
+        self._doc_ids: dict[str, int] = {doc["serial"]: doc.doc_id for doc in self._table.all()}
+        # serial -> loaded credentials, valid for one storage generation
+        self._credentials: dict[str, CohnCredentials] = {}
+        self._credentials_generation = -1
         logger.info(f"COHN configuration database initialized: {db_path}")
 
     def __enter__(self) -> CohnConfigManager:
@@ -141,6 +200,38 @@ class CohnConfigManager:
             if hasattr(self, "_db") and self._db is not None:
                 self._db.close()
 
+    def _sync_credentials_cache(self) -> None:
+        """Drop cached credentials if the database changed since they were loaded."""
+        self._storage.read()  # Only re-parses the file if it changed on disk
+        if self._storage.generation != self._credentials_generation:
+            self._credentials.clear()
+            self._credentials_generation = self._storage.generation
+
+    def _find(self, serial: str) -> Document | None:
+        """Find the credentials document of a camera.
+
+        The serial index is only a hint: another manager (or process) may have changed the
+        database file, so an indexed document is verified and a miss falls back to a scan.
+
+        Args:
+            serial: Camera serial number (last 4 digits)
+
+        Returns:
+            Credentials document, or None if not found
+        """
+        doc_id = self._doc_ids.get(serial)
+        if doc_id is not None:
+            doc = self._table.get(doc_id=doc_id)
+            if doc is not None and doc["serial"] == serial:
+                return doc
+            del self._doc_ids[serial]
+
+        result = self._table.search(_serial_field == serial)
+        if not result:
+            return None
+        self._doc_ids[serial] = result[0].doc_id
+        return result[0]
+
     def save(self, serial: str, credentials: CohnCredentials) -> None:
         """Save or update camera COHN credentials.
 
@@ -148,40 +239,63 @@ class CohnConfigManager:
             serial: Camera serial number (last 4 digits)
             credentials: COHN credentials
         """
-        query = Query()
         data = {"serial": serial, **credentials.to_dict()}
+        known = serial in self._doc_ids
 
-        # Update or insert
-        if self._table.search(query.serial == serial):
-            self._table.update(data, query.serial == serial)
-            logger.info(f"Updated COHN credentials for camera {serial}")
-        else:
-            self._table.insert(data)
-            logger.info(f"Saved COHN credentials for camera {serial}")
+        # Update or insert in a single read + write of the database file
+        self._doc_ids[serial] = self._table.upsert(data, _serial_field == serial)[0]
+        logger.info(f"{'Updated' if known else 'Saved'} COHN credentials for camera {serial}")
+
+    def save_many(self, items: dict[str, CohnCredentials]) -> None:
+        """Save or update COHN credentials of several cameras at once.
+
+        Writes the database file at most twice (one update pass, one insert pass) instead of
+        once per camera, e.g. when restoring an export or provisioning a batch of cameras.
+
+        Args:
+            items: Mapping from camera serial number (last 4 digits) to COHN credentials
+        """
+        updates: list[tuple[dict[str, str], Any]] = []
+        inserts: list[dict[str, str]] = []
+        for serial, credentials in items.items():
+            data = {"serial": serial, **credentials.to_dict()}
+            if self._find(serial) is not None:
+                updates.append((data, _serial_field == serial))
+            else:
+                inserts.append(data)
+
+        if updates:
+            self._table.update_multiple(updates)
+        if inserts:
+            doc_ids = self._table.insert_multiple(inserts)
+            self._doc_ids.update(zip((data["serial"] for data in inserts), doc_ids, strict=True))
+        logger.info(f"Saved COHN credentials for {len(items)} cameras ({len(updates)} updated, {len(inserts)} new)")
 
     def load(self, serial: str) -> CohnCredentials | None:
         """Load camera COHN credentials.
 
+        Credentials are cached until the database changes, so repeated loads (e.g. in reconnect
+        loops) return the same object without touching the file.
+
         Args:
             serial: Camera serial number (last 4 digits)
 
         Returns:
             COHN credentials, or None if not found
         """
-        query = Query()
-        result = self._table.search(query.serial == serial)
+        self._sync_credentials_cache()
+        credentials = self._credentials.get(serial)
+        if credentials is not None:
+            return credentials
 
-        if not result:
+        data = self._find(serial)
+
+        if data is None:
             logger.debug(f"COHN credentials not found for camera {serial}")
             return None
 
-        data = result[0]
-        credentials = CohnCredentials.from_dict({
-            "ip_address": data["ip_address"],
-            "username": data["username"],
-            "password": data["password"],
-            "certificate": data["certificate"],
-        })
+        credentials = CohnCredentials.from_dict(data)
+        self._credentials[serial] = credentials
         logger.debug(f"Loaded COHN credentials for camera {serial}: {credentials.ip_address}")
         return credentials
 
@@ -194,9 +308,10 @@ class CohnConfigManager:
         Returns:
             Whether deletion was successful
         """
-        query = Query()
-        removed = self._table.remove(query.serial == serial)
-        if removed:
+        doc = self._find(serial)
+        if doc is not None:
+            self._table.remove(doc_ids=[doc.doc_id])
+            del self._doc_ids[serial]
             logger.info(f"Deleted COHN credentials for camera {serial}")
             return True
         else:
@@ -209,19 +324,14 @@ class CohnConfigManager:
         Returns:
             Mapping from serial number to credentials
         """
-        all_records = self._table.all()
-        result = {}
-
-        for record in all_records:
-            serial = record["serial"]
-            credentials = CohnCredentials.from_dict({
-                "ip_address": record["ip_address"],
-                "username": record["username"],
-                "password": record["password"],
-                "certificate": record["certificate"],
-            })
-            result[serial] = credentials
+        self._sync_credentials_cache()
+        if len(self._credentials) == len(self._table):
+            return dict(self._credentials)
+
+        # Records carry the credential fields plus "serial", which from_dict ignores
+        result = {record["serial"]: CohnCredentials.from_dict(record) for record in self._table.all()}
 
+        self._credentials.update(result)
         logger.debug(f"Listed all COHN credentials, total: {len(result)}")
         return result
 
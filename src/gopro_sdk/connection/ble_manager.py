@@ -14,6 +14,8 @@ import contextlib
 import logging
 import re
 import traceback
+from collections import deque
+from collections.abc import Generator
 from typing import Any
 
 from bleak import BleakClient, BleakScanner
@@ -42,6 +44,9 @@ HEADER_EXT_13_PREFIX = 0x20  # 0b00100000: Extended 13-bit header prefix
 HEADER_EXT_16_PREFIX = 0x40  # 0b01000000: Extended 16-bit header prefix
 CONTINUATION_HEADER = 0x80  # 0b10000000: Continuation packet header
 
+# Initial size of the response reassembly buffer (max Extended 13-bit response length)
+_ACCUMULATION_BUFFER_SIZE = 8192
+
 
 class BleConnectionManager:
     """BLE connection manager.
@@ -78,11 +83,21 @@ class BleConnectionManager:
 
         # BLE response handling
         self._response_queue: asyncio.Queue[bytes] = asyncio.Queue()
-        self._accumulating_response: bytearray = bytearray()
+        # Subscribed notifications: 2-byte [feature_id, action_id] prefix -> dedicated queue,
+        # bypassing the response queue
+        self._notification_queues: dict[bytes, asyncio.Queue[bytes]] = {}
+        # Completed responses handed over from the BLE callback thread, drained on the event loop
+        # by a single scheduled callback per burst
+        self._pending_responses: deque[bytes] = deque()
+        self._drain_scheduled: bool = False
+        # Reassembly buffer, allocated once and reused via the `_acc_pos` write cursor
+        self._accumulating_response: bytearray = bytearray(_ACCUMULATION_BUFFER_SIZE)
+        self._acc_pos: int = 0
         self._bytes_remaining: int = 0
 
-        # Fragment header buffer (for handling truncated header cases)
-        self._header_buffer: bytearray = bytearray()
+        # Fragment header stash (for handling truncated header cases): fixed 3-byte array + fill length
+        self._hdr_stash: bytearray = bytearray(3)
+        self._hdr_stash_len: int = 0
 
         # State
         self._is_connected = False
@@ -314,68 +329,82 @@ class BleConnectionManager:
                     sends incomplete headers. This situation is not handled in the official SDK,
                     but may occur with Windows BLE drivers or under high camera load.
         """
-        buf = bytearray(data)
-        logger.debug(f"📦 Received BLE notification (handle={handle}): {len(data)} bytes")
+        logger.debug("📦 Received BLE notification (handle=%s): %d bytes", handle, len(data))
 
         # Packet length validation
-        if len(buf) == 0:
+        if len(data) == 0:
             logger.warning("⚠️ Received empty packet, ignoring")
             return
 
+        # The notification is parsed in place, `start` being the offset of the payload after the header
+        buf = data
+
         # If there's a pending header buffer, try to complete it first
-        if self._header_buffer:
-            logger.debug(f"  🔄 Detected header buffer: {len(self._header_buffer)} bytes, attempting to complete...")
-            self._header_buffer.extend(buf)
-            buf = self._header_buffer
-            self._header_buffer = bytearray()  # Clear buffer
+        if self._hdr_stash_len:
+            logger.debug("  🔄 Detected header buffer: %d bytes, attempting to complete...", self._hdr_stash_len)
+            buf = self._hdr_stash[: self._hdr_stash_len] + data
+            self._hdr_stash_len = 0  # Clear buffer
 
         # Check if this is a continuation packet (bit 7 = 1)
-        if buf[0] & CONT_MASK:  # Continuation packet
-            buf = buf[1:]
-            self._accumulating_response.extend(buf)
-            self._bytes_remaining -= len(buf)
-            logger.debug(f"  ↪️ Continuation packet: +{len(buf)} bytes, {self._bytes_remaining} bytes remaining")
+        is_continuation = buf[0] & CONT_MASK
+        if is_continuation:
+            start = 1
         else:
             # New packet: parse header (only use bit 6-5, not including bit 7)
-            self._accumulating_response = bytearray()
+            self._acc_pos = 0
             header_type = (buf[0] & HDR_MASK) >> 5
 
             if header_type == HEADER_TYPE_GENERAL:
                 self._bytes_remaining = buf[0] & GEN_LEN_MASK
-                buf = buf[1:]
-                logger.debug(f"  🆕 New packet (General): length {self._bytes_remaining} bytes")
+                start = 1
+                logger.debug("  🆕 New packet (General): length %d bytes", self._bytes_remaining)
             elif header_type == HEADER_TYPE_EXT_13:
                 if len(buf) < 2:
                     # Header incomplete, buffer it and wait for next notification
-                    logger.debug(f"  ⏸️ Extended 13-bit header incomplete ({len(buf)}/2 bytes), buffering: {buf.hex()}")
-                    self._header_buffer = buf
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "  ⏸️ Extended 13-bit header incomplete (%d/2 bytes), buffering: %s", len(buf), buf.hex()
+                        )
+                    self._hdr_stash[: len(buf)] = buf
+                    self._hdr_stash_len = len(buf)
                     return
                 self._bytes_remaining = ((buf[0] & EXT_13_BYTE0_MASK) << 8) | buf[1]
-                buf = buf[2:]
+                start = 2
                 # Large packets (>1KB) are usually status notifications, reduce log level
                 if self._bytes_remaining > 1024:
                     logger.debug(
-                        f"  🆕 New packet (Extended 13-bit): length {self._bytes_remaining} bytes (status notification)"
+                        "  🆕 New packet (Extended 13-bit): length %d bytes (status notification)",
+                        self._bytes_remaining,
                     )
                 else:
-                    logger.debug(f"  🆕 New packet (Extended 13-bit): length {self._bytes_remaining} bytes")
+                    logger.debug("  🆕 New packet (Extended 13-bit): length %d bytes", self._bytes_remaining)
             elif header_type == HEADER_TYPE_EXT_16:
                 if len(buf) < 3:
                     # Header incomplete, buffer it and wait for next notification
-                    logger.debug(f"  ⏸️ Extended 16-bit header incomplete ({len(buf)}/3 bytes), buffering: {buf.hex()}")
-                    self._header_buffer = buf
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "  ⏸️ Extended 16-bit header incomplete (%d/3 bytes), buffering: %s", len(buf), buf.hex()
+                        )
+                    self._hdr_stash[: len(buf)] = buf
+                    self._hdr_stash_len = len(buf)
                     return
                 self._bytes_remaining = (buf[1] << 8) | buf[2]
-                buf = buf[3:]
-                logger.debug(f"  🆕 New packet (Extended 16-bit): length {self._bytes_remaining} bytes")
+                start = 3
+                logger.debug("  🆕 New packet (Extended 16-bit): length %d bytes", self._bytes_remaining)
             else:
                 logger.warning(
                     f"⚠️ Unknown header type: {header_type} (bit 6-5 = 0b{header_type:02b}, data: {buf.hex()})"
                 )
                 return
 
-            self._accumulating_response.extend(buf)
-            self._bytes_remaining -= len(buf)
+        # Copy the payload to the write cursor (slice assignment grows the buffer for larger Ext-16 responses)
+        payload_len = len(buf) - start
+        pos = self._acc_pos
+        self._accumulating_response[pos : pos + payload_len] = memoryview(buf)[start:]
+        self._acc_pos = pos + payload_len
+        self._bytes_remaining -= payload_len
+        if is_continuation:
+            logger.debug("  ↪️ Continuation packet: +%d bytes, %d bytes remaining", payload_len, self._bytes_remaining)
 
         # Check if reception is complete
         if self._bytes_remaining < 0:
@@ -383,38 +412,111 @@ class BleConnectionManager:
                 f"❌ Received too much data! Remaining bytes: {self._bytes_remaining} (parsing state abnormal)"
             )
             # Reset state
-            self._accumulating_response = bytearray()
+            self._acc_pos = 0
             self._bytes_remaining = 0
         elif self._bytes_remaining == 0:
-            complete_data = bytes(self._accumulating_response)
-            logger.debug(f"  ✅ Response complete: {len(complete_data)} bytes")
+            complete_data = bytes(self._accumulating_response[: self._acc_pos])
+            logger.debug("  ✅ Response complete: %d bytes", len(complete_data))
 
-            # Use thread-safe method to put data into queue
+            # Hand over to the event loop thread-safely
             # In GUI environment (qasync), BLE callbacks may run in different threads
-            # Use event loop reference saved during initialization to avoid calling get_event_loop() in callback thread
-            try:
-                logger.debug(f"  📤 Using event loop {self._loop} to put data into queue (thread-safe)")
-                # call_soon_threadsafe ensures execution in the correct event loop
-                self._loop.call_soon_threadsafe(self._put_response_safe, complete_data)
-            except Exception as e:
-                logger.error(f"  ❌ Failed to put into queue: {e}, falling back to direct put_nowait", exc_info=True)
+            # deque.append is atomic; only one drain is scheduled until it has run, so a burst of
+            # responses costs a single cross-thread wakeup
+            self._pending_responses.append(complete_data)
+            if not self._drain_scheduled:
+                self._drain_scheduled = True
+                # Use event loop reference saved during initialization to avoid calling get_event_loop() in callback thread
                 try:
-                    self._response_queue.put_nowait(complete_data)
-                    logger.debug("  ✅ Response put into queue (direct)")
-                except asyncio.QueueFull:
-                    logger.warning("  ⚠️ Response queue full, discarding response")
+                    logger.debug("  📤 Using event loop %s to put data into queue (thread-safe)", self._loop)
+                    # call_soon_threadsafe ensures execution in the correct event loop
+                    self._loop.call_soon_threadsafe(self._drain_responses)
+                except Exception as e:
+                    logger.error(
+                        f"  ❌ Failed to put into queue: {e}, falling back to direct put_nowait", exc_info=True
+                    )
+                    self._drain_responses()
 
-            self._accumulating_response = bytearray()
+            self._acc_pos = 0
             self._bytes_remaining = 0
 
+    def _drain_responses(self) -> None:
+        """Move all pending responses into their queues (called by call_soon_threadsafe)."""
+        # Clear the flag first: a response appended from now on schedules a new drain
+        self._drain_scheduled = False
+        pending = self._pending_responses
+        while pending:
+            self._put_response_safe(pending.popleft())
+
     def _put_response_safe(self, data: bytes) -> None:
-        """Thread-safely put response into queue (called by call_soon_threadsafe)"""
+        """Thread-safely put response into queue (called by call_soon_threadsafe)
+
+        Responses matching a notification subscription go to that subscription's queue instead.
+        """
+        # Single bytes-prefix lookup (shorter responses can't match a 2-byte key)
+        queue = self._notification_queues.get(data[:2], self._response_queue)
         try:
-            self._response_queue.put_nowait(data)
-            logger.debug(f"  ✅ Response put into queue (thread-safe): {len(data)} bytes")
+            queue.put_nowait(data)
+            logger.debug("  ✅ Response put into queue (thread-safe): %d bytes", len(data))
         except asyncio.QueueFull:
             logger.warning(f"  ⚠️ Response queue full, discarding response: {len(data)} bytes")
 
+    @contextlib.contextmanager
+    def subscribe_notifications(self, feature_id: int, action_id: int) -> Generator[asyncio.Queue[bytes]]:
+        """Route responses of one notification type to a dedicated queue while the context is active.
+
+        Lets a caller wait for an asynchronous notification (e.g. scan or provisioning state)
+        without re-arming `wait_for_response` and skipping unrelated responses. Subscribe before
+        sending the command that triggers the notification, so none can be missed.
+
+        Args:
+            feature_id: Feature ID (first byte of the response)
+            action_id: Action ID (second byte of the response)
+
+        Yields:
+            Queue receiving the complete responses (including the 2-byte feature/action prefix)
+
+        Usage example:
+            >>> with ble.subscribe_notifications(0x02, 0x0B) as notifications:
+            ...     await ble.write(uuid, command)
+            ...     data = await notifications.get()
+        """
+        key = bytes((feature_id, action_id))
+        queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._notification_queues[key] = queue
+        try:
+            yield queue
+        finally:
+            if self._notification_queues.get(key) is queue:
+                del self._notification_queues[key]
+
+    async def write_and_await(
+        self, uuid: str, data: bytes, expect: tuple[int, int], timeout: float | None = None
+    ) -> bytes:
+        """Write a command and wait for the response correlated with it.
+
+        The response is bound to this request (by its [feature_id, action_id] prefix) before writing,
+        so stale responses in the response queue or unrelated notifications are never mistaken
+        for it and the response queue doesn't need to be cleared.
+
+        Args:
+            uuid: Characteristic UUID string
+            data: Command data
+            expect: (feature_id, action_id) of the expected response
+            timeout: Timeout in seconds, None means use default timeout
+
+        Returns:
+            Response data
+
+        Raises:
+            BleConnectionError: Write failed or wait timeout
+        """
+        with self.subscribe_notifications(*expect) as responses:
+            await self.write(uuid, data)
+            try:
+                return await asyncio.wait_for(responses.get(), timeout=timeout or self._timeout.ble_read_timeout)
+            except TimeoutError as e:
+                raise BleConnectionError("BLE response wait timeout") from e
+
     async def wait_for_response(self, timeout: float | None = None) -> bytes:
         """Wait for BLE response.
 
@@ -472,32 +574,37 @@ class BleConnectionManager:
         else:
             raise ValueError(f"Data length {data_len} too long (max 65535 bytes)")
 
-        packets = []
-        remaining_data = data
+        # Packet count is known up front, so the list is allocated once
+        first_packet_payload_size = max_ble_pkt_len - len(header)
+        continuation_payload_size = max_ble_pkt_len - 1
+        n_packets = 1 + max(0, -(-(data_len - first_packet_payload_size) // continuation_payload_size))
+        packets: list[bytes] = [b""] * n_packets
+
+        # Payloads are taken from a memoryview, so each packet is built with a single copy
+        view = memoryview(data)
 
         # First packet: header + payload
-        first_packet_payload_size = max_ble_pkt_len - len(header)
-        first_packet = bytearray(header)
-        first_packet.extend(remaining_data[:first_packet_payload_size])
-        packets.append(bytes(first_packet))
-        remaining_data = remaining_data[first_packet_payload_size:]
+        packets[0] = header + view[:first_packet_payload_size]
 
         # Subsequent packets: continuation header + payload
-        while remaining_data:
-            packet = bytearray([CONTINUATION_HEADER])
-            packet.extend(remaining_data[: max_ble_pkt_len - 1])
-            packets.append(bytes(packet))
-            remaining_data = remaining_data[max_ble_pkt_len - 1 :]
+        continuation_header = bytes((CONTINUATION_HEADER,))
+        offset = first_packet_payload_size
+        for i in range(1, n_packets):
+            packets[i] = continuation_header + view[offset : offset + continuation_payload_size]
+            offset += continuation_payload_size
 
-        logger.debug(f"Data fragmented: {data_len} bytes → {len(packets)} packet(s)")
+        logger.debug("Data fragmented: %d bytes → %d packet(s)", data_len, len(packets))
         return packets
 
-    async def write(self, uuid: str, data: bytes) -> None:
+    async def write(self, uuid: str, data: bytes, response: bool = True) -> None:
         """Write BLE data (automatic fragmentation).
 
         Args:
             uuid: Characteristic UUID string (standard format: 8-4-4-4-12)
             data: Data to write
+            response: Wait for the write response of each packet. If False, packets are sent back-to-back
+                as write-without-response, saving a round-trip per packet (falls back to write-with-response
+                if the characteristic doesn't support it)
 
         Raises:
             BleConnectionError: Write failed
@@ -505,14 +612,20 @@ class BleConnectionManager:
         if not self._ble_client:
             raise BleConnectionError("BLE not connected")
 
-        logger.debug(f"📤 Writing BLE data to {uuid}: {len(data)} bytes")
+        logger.debug("📤 Writing BLE data to %s: %d bytes", uuid, len(data))
+
+        if not response:
+            characteristic = self._ble_client.services.get_characteristic(uuid)
+            if characteristic is None or "write-without-response" not in characteristic.properties:
+                logger.debug("  Characteristic %s doesn't support write-without-response, waiting for responses", uuid)
+                response = True
 
-        # Fragment and send one by one
+        # Fragment and send one by one (awaited in order: fragments must arrive in sequence)
         packets = self._fragment(data)
         for i, packet in enumerate(packets, 1):
-            logger.debug(f"  Sending packet {i}/{len(packets)}: {len(packet)} bytes")
+            logger.debug("  Sending packet %d/%d: %d bytes", i, len(packets), len(packet))
             # Use bleak's write_gatt_char (based on Tutorial)
-            await self._ble_client.write_gatt_char(uuid, packet, response=True)
+            await self._ble_client.write_gatt_char(uuid, packet, response=response)
 
     def clear_response_queue(self) -> None:
         """Clear response queue."""
@@ -110,7 +110,7 @@ class HealthCheckMixin:
             except Exception as e:
                 logger.warning(f"Reconnect attempt {attempt} failed: {e}")
                 if attempt < self._max_reconnect_attempts:
-                    wait_time = min(2**attempt, 10)  # Exponential backoff, max 10 seconds
+                    wait_time = min(1 << attempt, 10)  # Exponential backoff, max 10 seconds
                     logger.info(f"Waiting {wait_time} seconds before retry...")
                     await asyncio.sleep(wait_time)
 
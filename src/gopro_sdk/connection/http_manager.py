@@ -5,11 +5,12 @@ Responsible for establishing, disconnecting HTTP connections and COHN configurat
 
 from __future__ import annotations
 
-__all__ = ["HttpConnectionManager"]
+__all__ = ["HttpConnectionManager", "TokenBucket"]
 
 import asyncio
 import logging
 import ssl
+import time
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -17,10 +18,77 @@ from typing import Any
 import aiohttp
 
 from ..config import CohnCredentials, TimeoutConfig
-from ..exceptions import HttpConnectionError
+from ..exceptions import HttpConnectionError, UnrecoverableHttpError
 
 logger = logging.getLogger(__name__)
 
+# Pooled connections kept open to the camera, and how long an idle one is kept for reuse (seconds)
+_DEFAULT_CONNECTION_LIMIT = 8
+_KEEPALIVE_TIMEOUT = 75.0
+
+# Download write block size, and how many blocks pass between progress callbacks (power of two, used as a bitmask)
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+_PROGRESS_EVERY_CHUNKS = 16
+
+# Statuses meaning the camera is overloaded, the request rate is lowered when they are seen
+_THROTTLE_HTTP_STATUSES = frozenset({429, 503})
+
+
+class TokenBucket:
+    """Adaptive token-bucket rate limiter for requests to one camera.
+
+    Requests within the burst capacity pass immediately. The refill rate is halved each time the
+    camera reports overload (429/503) and grows back by 10% per successful response, so commands
+    and retries from all command interfaces back off together instead of piling onto a struggling camera.
+
+    Attributes:
+        rate: Current refill rate (requests per second)
+        max_rate: Refill rate restored when the camera is healthy
+        min_rate: Lower bound of the refill rate
+        capacity: Maximum burst size (requests)
+    """
+
+    __slots__ = ("_tokens", "_updated_at", "capacity", "max_rate", "min_rate", "rate")
+
+    def __init__(self, max_rate: float = 20.0, capacity: float = 10.0, min_rate: float = 0.5) -> None:
+        """Initialize token bucket (starts full, at max_rate).
+
+        Args:
+            max_rate: Refill rate when the camera is healthy (requests per second)
+            capacity: Maximum burst size (requests)
+            min_rate: Lower bound of the refill rate (requests per second)
+        """
+        self.rate = self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for the refill if the bucket is empty.
+
+        Tokens are reserved before waiting (the balance may go negative), so concurrent
+        callers queue up in order without a lock.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate) - 1
+        self._updated_at = now
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+    def record_status(self, status: int) -> None:
+        """Adapt the refill rate to an HTTP response status.
+
+        Args:
+            status: HTTP status code
+        """
+        if status in _THROTTLE_HTTP_STATUSES:
+            if self.rate > self.min_rate:
+                self.rate = max(self.min_rate, self.rate * 0.5)
+                logger.warning("⚠️ Camera overloaded (HTTP %d), request rate lowered to %.1f/s", status, self.rate)
+        elif self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate * 1.1)
+
 
 class HttpConnectionManager:
     """HTTP/COHN connection manager.
@@ -29,6 +97,13 @@ class HttpConnectionManager:
     - Establish and disconnect HTTP sessions
     - Configure SSL context (support COHN self-signed certificates)
     - Send HTTP requests and handle responses
+
+    All command interfaces share the manager's single session, so requests reuse
+    pooled keep-alive connections instead of paying a TLS handshake each time.
+
+    Supports async context manager protocol:
+        async with HttpConnectionManager(target, timeout_config, credentials) as http:
+            ...
     """
 
     def __init__(
@@ -36,6 +111,7 @@ class HttpConnectionManager:
         target: str,
         timeout_config: TimeoutConfig,
         credentials: CohnCredentials | None = None,
+        connection_limit: int = _DEFAULT_CONNECTION_LIMIT,
     ) -> None:
         """Initialize HTTP connection manager.
 
@@ -43,10 +119,12 @@ class HttpConnectionManager:
             target: Last four digits of camera serial number
             timeout_config: Timeout configuration
             credentials: COHN credentials (optional, can be set later)
+            connection_limit: Maximum concurrent connections to the camera (downloads included)
         """
         self.target = target
         self._timeout = timeout_config
         self._credentials = credentials
+        self._connection_limit = connection_limit
 
         # HTTP session
         self._session: aiohttp.ClientSession | None = None
@@ -56,6 +134,18 @@ class HttpConnectionManager:
         self._is_connected = False
         self._error_count = 0
 
+        # Shared by all command interfaces of this camera
+        self.limiter = TokenBucket()
+
+    async def __aenter__(self) -> HttpConnectionManager:
+        """Async context manager entry point (automatically calls connect)."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit point (automatically calls disconnect)."""
+        await self.disconnect()
+
     @property
     def is_connected(self) -> bool:
         """Whether HTTP is connected."""
@@ -124,10 +214,17 @@ class HttpConnectionManager:
             timeout = aiohttp.ClientTimeout(total=self._timeout.http_request_timeout)
             auth = aiohttp.BasicAuth(self._credentials.username, self._credentials.password)
 
+            # A session left over from a failed attempt would leak its connector
+            await self._close_session()
             self._session = aiohttp.ClientSession(
                 timeout=timeout,
                 auth=auth,
-                connector=aiohttp.TCPConnector(ssl=self._ssl_context),
+                connector=aiohttp.TCPConnector(
+                    ssl=self._ssl_context,
+                    limit=self._connection_limit,
+                    limit_per_host=self._connection_limit,
+                    keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                ),
             )
 
             # Test connection (with retry, ensure HTTPS service is ready)
@@ -137,6 +234,7 @@ class HttpConnectionManager:
             logger.info(f"✅ HTTP (COHN) connection to camera {self.target} successful")
 
         except Exception as e:
+            await self._close_session()
             msg = f"HTTP connection to camera {self.target} failed: {e}"
             logger.error(msg)
 
@@ -304,9 +402,7 @@ class HttpConnectionManager:
             return
 
         try:
-            if self._session:
-                await self._session.close()
-                self._session = None
+            await self._close_session()
 
             self._is_connected = False
             logger.info(f"HTTP for camera {self.target} disconnected")
@@ -314,7 +410,15 @@ class HttpConnectionManager:
         except Exception as e:
             logger.warning(f"Error disconnecting HTTP for camera {self.target}: {e}")
 
-    def get(self, endpoint: str, params: dict[str, Any] | None = None) -> _AutoConnectContext:
+    async def _close_session(self) -> None:
+        """Close the HTTP session and its pooled connections, if any."""
+        if self._session:
+            session, self._session = self._session, None
+            await session.close()
+
+    def get(
+        self, endpoint: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None
+    ) -> _AutoConnectContext:
         """Send GET request (returns async context manager).
 
         Note:
@@ -325,6 +429,7 @@ class HttpConnectionManager:
         Args:
             endpoint: API endpoint (relative path, e.g., "gopro/camera/state")
             params: Query parameters
+            headers: Extra request headers
 
         Returns:
             Async context manager for HTTP response (_AutoConnectContext)
@@ -336,7 +441,7 @@ class HttpConnectionManager:
             async with self.get("gopro/camera/state") as resp:
                 data = await resp.json()
         """
-        return _AutoConnectContext(self, endpoint, params, method="GET")
+        return _AutoConnectContext(self, endpoint, params, method="GET", headers=headers)
 
     def put(self, endpoint: str, data: Any = None) -> _AutoConnectContext:
         """Send PUT request (returns async context manager).
@@ -366,16 +471,21 @@ class HttpConnectionManager:
         self,
         endpoint: str,
         destination: str,
-        chunk_size: int = 8192,
+        chunk_size: int = _DOWNLOAD_CHUNK_SIZE,
         progress_callback: Callable[[int, int], None] | None = None,
     ) -> int:
         """Download file.
 
+        The response is streamed and collected into large blocks that are written from a worker thread,
+        so the event loop stays responsive during multi-GB transfers. The request uses `http_download_timeout` instead of
+        the shorter per-request timeout of the session.
+
         Args:
             endpoint: API endpoint
             destination: Destination file path
-            chunk_size: Chunk size
-            progress_callback: Progress callback function (downloaded: int, total: int) -> None
+            chunk_size: Bytes collected before each file write
+            progress_callback: Progress callback function (downloaded: int, total: int) -> None,
+                called every few writes and once when the download completes
 
         Returns:
             Number of bytes downloaded
@@ -391,28 +501,49 @@ class HttpConnectionManager:
             raise HttpConnectionError("HTTP session not created")
 
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.debug(f"DOWNLOAD {url} -> {destination}")
+        logger.debug("DOWNLOAD %s -> %s", url, destination)
 
+        await self.limiter.acquire()
         try:
             downloaded = 0
-            async with self._session.get(url) as resp:
+            async with self._session.get(
+                url, timeout=aiohttp.ClientTimeout(total=self._timeout.http_download_timeout)
+            ) as resp:
+                self.limiter.record_status(resp.status)
                 if resp.status != 200:
-                    raise HttpConnectionError(f"Download failed: HTTP {resp.status}")
+                    raise HttpConnectionError.from_status(resp.status, f"Download failed: HTTP {resp.status}")
 
                 # Get total file size
                 total_size = int(resp.headers.get("Content-Length", 0))
 
                 with Path(destination).open("wb") as f:
+                    # The stream yields whatever has arrived (often a few KiB): collect it into
+                    # chunk_size blocks so each thread hop writes a large block
+                    block = bytearray()
+                    block_count = 0
                     async for chunk in resp.content.iter_chunked(chunk_size):
-                        f.write(chunk)
+                        block += chunk
                         downloaded += len(chunk)
+                        if len(block) < chunk_size:
+                            continue
 
-                        # Call progress callback
-                        if progress_callback:
+                        await asyncio.to_thread(f.write, block)
+                        block.clear()
+                        block_count += 1
+
+                        if progress_callback and not block_count & (_PROGRESS_EVERY_CHUNKS - 1):
                             progress_callback(downloaded, total_size)
 
+                    if block:
+                        await asyncio.to_thread(f.write, block)
+
+                if progress_callback:
+                    progress_callback(downloaded, total_size)
+
             return downloaded
 
+        except UnrecoverableHttpError:
+            raise
         except Exception as e:
             self._error_count += 1
             raise HttpConnectionError(f"Failed to download file: {e}") from e
@@ -430,6 +561,7 @@ class _AutoConnectContext:
         endpoint: str,
         data: Any,
         method: str,
+        headers: dict[str, str] | None = None,
     ) -> None:
         """Initialize automatic connection context.
 
@@ -438,11 +570,13 @@ class _AutoConnectContext:
             endpoint: API endpoint
             data: Request data (params for GET, body for PUT)
             method: HTTP method ("GET" or "PUT")
+            headers: Extra request headers
         """
         self.manager = manager
         self.endpoint = endpoint
         self.data = data
         self.method = method
+        self.headers = headers
         self._context = None
 
     async def __aenter__(self):
@@ -455,18 +589,21 @@ class _AutoConnectContext:
             raise HttpConnectionError("HTTP session not created")
 
         url = f"{self.manager.base_url}/{self.endpoint.lstrip('/')}"
+        await self.manager.limiter.acquire()
 
         try:
             if self.method == "GET":
-                logger.debug(f"GET {url} params={self.data}")
-                self._context = self.manager._session.get(url, params=self.data)
+                logger.debug("GET %s params=%s", url, self.data)
+                self._context = self.manager._session.get(url, params=self.data, headers=self.headers)
             elif self.method == "PUT":
-                logger.debug(f"PUT {url}")
+                logger.debug("PUT %s", url)
                 self._context = self.manager._session.put(url, json=self.data)
             else:
                 raise ValueError(f"Unsupported HTTP method: {self.method}")
 
-            return await self._context.__aenter__()
+            resp = await self._context.__aenter__()
+            self.manager.limiter.record_status(resp.status)
+            return resp
         except Exception as e:
             raise HttpConnectionError(f"HTTP {self.method} request failed: {e}") from e
 
@@ -1,12 +1,17 @@
 """Custom exception classes."""
 
+from __future__ import annotations
+
 __all__ = [
+    "UNRECOVERABLE_HTTP_STATUSES",
     "BleConnectionError",
     "BleTimeoutError",
     "CohnConfigurationError",
     "CohnNotConfiguredError",
     "CustomGoProError",
     "HttpConnectionError",
+    "UnrecoverableHttpError",
+    "WifiProvisioningError",
 ]
 
 
@@ -22,9 +27,44 @@ class BleTimeoutError(BleConnectionError):
     """BLE response timeout error."""
 
 
+class WifiProvisioningError(BleConnectionError):
+    """Camera reported a failed WiFi provisioning state (wrong password, AP unreachable, etc.).
+
+    Attributes:
+        provisioning_state: EnumProvisioning value reported by the camera
+    """
+
+    def __init__(self, message: str, provisioning_state: int) -> None:
+        super().__init__(message)
+        self.provisioning_state = provisioning_state
+
+
+# Statuses meaning the request itself is wrong (bad parameter, unknown path), not that the camera is unreachable
+UNRECOVERABLE_HTTP_STATUSES = frozenset({400, 404, 422})
+
+
 class HttpConnectionError(CustomGoProError):
     """HTTP connection related error."""
 
+    @classmethod
+    def from_status(cls, status: int, message: str) -> HttpConnectionError:
+        """Create the error for a failed HTTP status.
+
+        Args:
+            status: HTTP status code of the response
+            message: Error message
+
+        Returns:
+            `UnrecoverableHttpError` for statuses in `UNRECOVERABLE_HTTP_STATUSES`, otherwise `HttpConnectionError`
+        """
+        if status in UNRECOVERABLE_HTTP_STATUSES:
+            return UnrecoverableHttpError(message)
+        return HttpConnectionError(message)
+
+
+class UnrecoverableHttpError(HttpConnectionError):
+    """Camera rejected the HTTP request itself (invalid setting, missing file, etc.), retrying cannot succeed."""
+
 
 class CohnNotConfiguredError(CustomGoProError):
     """COHN not configured error."""
@@ -13,7 +13,7 @@ from collections.abc import Callable
 from typing import Any
 
 from .client import GoProClient
-from .config import CohnConfigManager, TimeoutConfig
+from .config import DEFAULT_TIMEOUT_CONFIG, CohnConfigManager, TimeoutConfig
 
 logger = logging.getLogger(__name__)
 
@@ -92,7 +92,7 @@ class MultiCameraManager:
             offline_mode: Offline mode (default True), BLE connection only, no preview/download support
         """
         self.camera_ids: list[str] = camera_ids if camera_ids is not None else []
-        self._timeout_config = timeout_config or TimeoutConfig()
+        self._timeout_config = timeout_config or DEFAULT_TIMEOUT_CONFIG
         self._config_manager = config_manager or CohnConfigManager()
         self._max_concurrent = max_concurrent
         self._wifi_ssid = wifi_ssid
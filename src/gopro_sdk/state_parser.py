@@ -7,6 +7,7 @@ from __future__ import annotations
 
 __all__ = [
     "format_camera_state",
+    "get_raw_status_value",
     "get_setting_value",
     "get_status_value",
     "is_camera_busy",
@@ -25,6 +26,9 @@ from open_gopro.models.types import CameraState, ResponseType
 
 logger = logging.getLogger(__name__)
 
+# StatusId -> key used in the raw "status" dict, built once to avoid per-lookup enum conversion
+_STATUS_KEYS: dict[StatusId, str] = {status_id: str(status_id.value) for status_id in StatusId}
+
 
 def parse_camera_state(raw_state: dict[str, Any]) -> CameraState:
     """Parse camera state data.
@@ -139,6 +143,30 @@ def get_status_value(state: CameraState, status_id: StatusId) -> Any | None:
     return state.get(status_id)
 
 
+def get_raw_status_value(raw_state: dict[str, Any], status_id: StatusId) -> Any | None:
+    """Get the value of a specified status directly from raw state data.
+
+    Cheaper than `parse_camera_state()` when only a few status values are needed,
+    e.g. when polling.
+
+    Args:
+        raw_state: Raw state data as returned by the camera (string ID keys)
+        status_id: Status ID
+
+    Returns:
+        Raw status value, or None if it doesn't exist
+
+    Examples:
+        >>> raw = {"status": {"8": 0, "10": 1}, "settings": {}}
+        >>> get_raw_status_value(raw, StatusId.ENCODING)
+        1
+    """
+    status = raw_state.get("status")
+    if not status:
+        return None
+    return status.get(_STATUS_KEYS[status_id])
+
+
 def get_setting_value(state: CameraState, setting_id: SettingId) -> Any | None:
     """Get the value of a specified setting from the state dictionary.
 
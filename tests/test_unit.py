@@ -53,3 +53,518 @@ async def test_client_creation():
     client = GoProClient("1332")
     assert client is not None
     assert client.target == "1332"
+
+
+@pytest.fixture
+async def ready_client(tmp_path, monkeypatch):
+    """GoProClient whose camera state polls and sleeps run on a fake clock.
+
+    Set `client.states` to the sequence of poll results (state dicts, or exceptions to raise);
+    the requested sleeps are recorded in `client.sleeps`.
+    """
+    from types import SimpleNamespace
+
+    import gopro_sdk.client as client_module
+    from gopro_sdk import GoProClient
+    from gopro_sdk.config import CohnConfigManager
+
+    client = GoProClient("1332", offline_mode=False, config_manager=CohnConfigManager(tmp_path / "credentials.json"))
+    clock = SimpleNamespace(now=0.0)
+    client.states = []
+    client.sleeps = []
+
+    async def get_camera_state():
+        state = client.states.pop(0)
+        if isinstance(state, Exception):
+            raise state
+        return state
+
+    async def sleep(delay):
+        client.sleeps.append(delay)
+        clock.now += delay
+
+    monkeypatch.setattr(client.http_commands, "get_camera_state", get_camera_state)
+    monkeypatch.setattr(client_module, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    monkeypatch.setattr(client_module, "asyncio", SimpleNamespace(sleep=sleep))
+    return client
+
+
+_BUSY_STATE = {"status": {"8": 1, "10": 0}, "settings": {}}
+_READY_STATE = {"status": {"8": 0, "10": 0}, "settings": {}}
+
+
+@pytest.mark.asyncio
+async def test_wait_camera_ready_polls_until_ready(ready_client):
+    """Test the busy -> ready transition, the fast retry after a failed check, and the time-to-ready average."""
+    from gopro_sdk.exceptions import HttpConnectionError
+
+    ready_client.states = [HttpConnectionError("Camera unreachable"), _BUSY_STATE, _BUSY_STATE, _READY_STATE]
+    await ready_client.wait_camera_ready(timeout=10.0, poll_interval=0.5)
+
+    assert ready_client.sleeps == pytest.approx([0.1, 0.5, 0.5])
+    assert ready_client._ready_wait_ewma == pytest.approx(0.8 * 0.5 + 0.2 * 1.1)
+
+    # A long usual time-to-ready spaces out the early polls, then polls at full rate
+    ready_client._ready_wait_ewma = 8.0
+    ready_client.sleeps = []
+    ready_client.states = [_BUSY_STATE] * 4 + [_READY_STATE]
+    await ready_client.wait_camera_ready(timeout=20.0, poll_interval=0.5)
+
+    assert ready_client.sleeps == pytest.approx([2.0, 2.0, 2.0, 0.5])
+
+
+@pytest.mark.asyncio
+async def test_wait_camera_ready_timeout(ready_client):
+    """Test that wait_camera_ready raises TimeoutError without sleeping past the timeout."""
+    ready_client.states = [_BUSY_STATE] * 10
+    with pytest.raises(TimeoutError):
+        await ready_client.wait_camera_ready(timeout=1.2, poll_interval=0.5)
+
+    assert ready_client.sleeps == pytest.approx([0.5, 0.5, 0.2])
+
+
+def test_get_raw_status_value():
+    """Test reading status values directly from raw camera state."""
+    from open_gopro.models.constants import StatusId
+
+    from gopro_sdk.state_parser import get_raw_status_value
+
+    raw = {"status": {"8": 0, "10": 1}, "settings": {}}
+    assert get_raw_status_value(raw, StatusId.ENCODING) == 1
+    assert get_raw_status_value(raw, StatusId.BUSY) == 0
+    assert get_raw_status_value(raw, StatusId.PREVIEW_STREAM) is None
+    assert get_raw_status_value({}, StatusId.BUSY) is None
+
+
+def test_circuit_breaker_state_machine():
+    """Test CircuitBreaker CLOSED -> OPEN -> HALF_OPEN -> CLOSED transitions."""
+    from gopro_sdk.commands import CircuitBreaker
+
+    breaker = CircuitBreaker(failure_threshold=2, open_duration=0.0)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # open_duration elapsed: one probe allowed while half-open
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+
+
+def test_with_http_retry_rejects_invalid_config():
+    """Test that with_http_retry validates its configuration when created."""
+    from gopro_sdk.commands import with_http_retry
+
+    with pytest.raises(ValueError):
+        with_http_retry(max_retries=0)
+    with pytest.raises(ValueError):
+        with_http_retry(backoff_factor=-1.0)
+
+
+@pytest.mark.asyncio
+async def test_with_http_retry_skips_unrecoverable_errors():
+    """Test that UnrecoverableHttpError is raised without retrying."""
+    from gopro_sdk.commands import with_http_retry
+    from gopro_sdk.exceptions import UnrecoverableHttpError
+
+    calls = 0
+
+    @with_http_retry(max_retries=3, backoff_factor=0.0)
+    async def command() -> None:
+        nonlocal calls
+        calls += 1
+        raise UnrecoverableHttpError("Failed to get setting (HTTP 400)")
+
+    with pytest.raises(UnrecoverableHttpError):
+        await command()
+    assert calls == 1
+
+
+class _RetryCommands:
+    """Minimal command instance with the attributes used by with_http_retry."""
+
+    def __init__(self, failures: int) -> None:
+        from gopro_sdk.commands import CircuitBreaker
+
+        self.failures = failures
+        self.calls = 0
+        self._http_error_count = 0
+        self._http_breaker = CircuitBreaker(failure_threshold=100)
+        self._http_retry_gate = None
+
+    async def request(self) -> str:
+        from gopro_sdk.exceptions import HttpConnectionError
+
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise HttpConnectionError("Camera unreachable")
+        return "ok"
+
+
+@pytest.mark.asyncio
+async def test_with_http_retry_cancelled_leader_releases_gate():
+    """Test that cancelling the command backing off for others doesn't leave waiting commands blocked."""
+    import asyncio
+
+    from gopro_sdk.commands import with_http_retry
+
+    commands = _RetryCommands(failures=2)
+    request = with_http_retry(max_retries=3, backoff_factor=10.0)(_RetryCommands.request)
+
+    leader = asyncio.create_task(request(commands))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(request(commands))
+    await asyncio.sleep(0)
+    assert commands._http_retry_gate is not None
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(leader, 0.05)
+
+    assert commands._http_retry_gate is None
+    assert await asyncio.wait_for(follower, 1.0) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_with_http_retry_shared_failure_recorded_once():
+    """Test that a failed shared retry is only counted for the command that sent it."""
+    import asyncio
+
+    from gopro_sdk.commands import with_http_retry
+    from gopro_sdk.exceptions import HttpConnectionError
+
+    commands = _RetryCommands(failures=100)
+    request = with_http_retry(max_retries=3, backoff_factor=0.01)(_RetryCommands.request)
+
+    results = await asyncio.gather(*(request(commands) for _ in range(5)), return_exceptions=True)
+
+    assert all(isinstance(result, HttpConnectionError) for result in results)
+    assert commands._http_error_count == commands.calls
+    assert commands._http_breaker.failures == commands.calls
+
+
+class _StateHttp:
+    """Fake HTTP manager answering camera state polls, with an optional ETag."""
+
+    def __init__(self, body: bytes, etag: str | None = None) -> None:
+        self.body = body
+        self.etag = etag
+        self.request_headers: list[dict[str, str] | None] = []
+
+    @staticmethod
+    def _response(status: int, body: bytes, headers: dict[str, str]):
+        from types import SimpleNamespace
+
+        async def read() -> bytes:
+            return body
+
+        async def text() -> str:
+            return body.decode()
+
+        return SimpleNamespace(status=status, headers=headers, read=read, text=text)
+
+    def get(self, endpoint: str, params=None, headers: dict[str, str] | None = None):
+        import contextlib
+
+        self.request_headers.append(headers)
+        if self.etag is not None and headers and headers.get("If-None-Match") == self.etag:
+            response = self._response(304, b"", {"ETag": self.etag})
+        else:
+            response = self._response(200, self.body, {"ETag": self.etag} if self.etag else {})
+
+        @contextlib.asynccontextmanager
+        async def request():
+            yield response
+
+        return request()
+
+
+@pytest.mark.asyncio
+async def test_get_camera_state_reuses_unchanged_state():
+    """Test that a 304 is answered from the cached body, and every poll returns an independent state."""
+    import json
+
+    from gopro_sdk.commands.http_commands import HttpCommands
+
+    state = {"status": {"10": 0}, "settings": {"2": 1}}
+
+    # 304 Not Modified: the ETag is sent back and the state decoded from the previous body
+    http = _StateHttp(json.dumps(state).encode(), etag='"v1"')
+    commands = HttpCommands(http)
+    first = await commands.get_camera_state()
+    first.pop("settings")
+    first["status"]["10"] = 1
+    assert await commands.get_camera_state() == state
+    assert http.request_headers == [None, {"If-None-Match": '"v1"'}]
+
+    # A new ETag delivers the changed state
+    http.body, http.etag = json.dumps({**state, "status": {"10": 1}}).encode(), '"v2"'
+    assert (await commands.get_camera_state())["status"] == {"10": 1}
+
+    # Without an ETag every poll is a plain request
+    http = _StateHttp(json.dumps(state).encode())
+    commands = HttpCommands(http)
+    assert await commands.get_camera_state() == await commands.get_camera_state() == state
+    assert http.request_headers == [None, None]
+
+
+@pytest.fixture
+def limiter_clock(monkeypatch):
+    """Fake clock for TokenBucket: `clock.now` is the monotonic time, requested sleeps go to `clock.sleeps`."""
+    from types import SimpleNamespace
+
+    import gopro_sdk.connection.http_manager as http_manager
+
+    clock = SimpleNamespace(now=0.0, sleeps=[])
+
+    async def sleep(delay):
+        clock.sleeps.append(delay)
+
+    monkeypatch.setattr(http_manager, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    monkeypatch.setattr(http_manager, "asyncio", SimpleNamespace(sleep=sleep))
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests(limiter_clock):
+    """Test that TokenBucket passes a full burst, then queues requests at the refill rate."""
+    from gopro_sdk.connection.http_manager import TokenBucket
+
+    bucket = TokenBucket(max_rate=20.0, capacity=10.0)
+    for _ in range(10):
+        await bucket.acquire()
+    assert limiter_clock.sleeps == []
+
+    # Tokens are reserved before waiting: each queued request waits one refill interval longer
+    await bucket.acquire()
+    await bucket.acquire()
+    assert limiter_clock.sleeps == pytest.approx([0.05, 0.1])
+
+    # Refilled after the wait, and never beyond capacity
+    limiter_clock.now = 100.0
+    limiter_clock.sleeps.clear()
+    for _ in range(10):
+        await bucket.acquire()
+    assert limiter_clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_adapts_rate(limiter_clock):
+    """Test that TokenBucket halves its rate on overload statuses and recovers on other responses."""
+    from gopro_sdk.connection.http_manager import TokenBucket
+
+    bucket = TokenBucket(max_rate=20.0, capacity=1.0, min_rate=0.5)
+    bucket.record_status(429)
+    bucket.record_status(503)
+    assert bucket.rate == pytest.approx(5.0)
+
+    # Pacing follows the lowered rate
+    await bucket.acquire()
+    await bucket.acquire()
+    assert limiter_clock.sleeps == pytest.approx([0.2])
+
+    for _ in range(10):
+        bucket.record_status(503)
+    assert bucket.rate == pytest.approx(0.5)
+
+    bucket.record_status(200)
+    assert bucket.rate == pytest.approx(0.55)
+    for _ in range(100):
+        bucket.record_status(200)
+    assert bucket.rate == pytest.approx(20.0)
+
+    # Rejected requests are still answers from a healthy camera
+    bucket.record_status(503)
+    bucket.record_status(404)
+    assert bucket.rate == pytest.approx(11.0)
+
+
+@pytest.mark.asyncio
+async def test_ble_notification_subscription_routing():
+    """Test that subscribed notifications bypass the BLE response queue."""
+    from open_gopro.models.constants import ActionId, FeatureId
+
+    from gopro_sdk.config import TimeoutConfig
+    from gopro_sdk.connection.ble_manager import BleConnectionManager
+
+    ble = BleConnectionManager("1332", TimeoutConfig())
+    scan_notification = bytes([FeatureId.NETWORK_MANAGEMENT, ActionId.NOTIF_START_SCAN, 0x08, 0x05])
+    response = bytes([FeatureId.NETWORK_MANAGEMENT, ActionId.SCAN_WIFI_NETWORKS_RSP, 0x08, 0x01])
+
+    with ble.subscribe_notifications(FeatureId.NETWORK_MANAGEMENT, ActionId.NOTIF_START_SCAN) as notifications:
+        ble._put_response_safe(scan_notification)
+        ble._put_response_safe(response)
+        assert notifications.get_nowait() == scan_notification
+        assert await ble.wait_for_response(timeout=0.1) == response
+
+    # Unsubscribed: notifications go to the response queue again
+    ble._put_response_safe(scan_notification)
+    assert await ble.wait_for_response(timeout=0.1) == scan_notification
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [0, 1, 18, 19, 200, 8191, 8192, 20000])
+async def test_ble_fragment_round_trip(size):
+    """Test that fragmented packets fed back as notifications reassemble into the original payload."""
+    import asyncio
+
+    from gopro_sdk.config import TimeoutConfig
+    from gopro_sdk.connection.ble_manager import BleConnectionManager
+
+    ble = BleConnectionManager("1332", TimeoutConfig())
+    payload = bytes(index * 7 % 251 for index in range(size))
+
+    packets = ble._fragment(payload)
+    header_size = 2 if size < 8192 else 3
+    assert len(packets) == 1 + max(0, -(-(size - (20 - header_size)) // 19))
+    assert all(len(packet) <= 20 for packet in packets)
+    assert all(packet[0] == 0x80 for packet in packets[1:])
+
+    for _ in range(2):  # The reassembly buffer is reused by the next response
+        for packet in packets:
+            ble._on_notification(1, bytearray(packet))
+        await asyncio.sleep(0)
+        assert await ble.wait_for_response(timeout=0.1) == payload
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("split", [1, 2])
+async def test_ble_split_header_reassembly(split):
+    """Test that a header truncated across notifications is completed by the next one."""
+    import asyncio
+
+    from gopro_sdk.config import TimeoutConfig
+    from gopro_sdk.connection.ble_manager import BleConnectionManager
+
+    ble = BleConnectionManager("1332", TimeoutConfig())
+    payload = bytes(range(256)) * 40  # Extended 16-bit header (3 bytes)
+    first, *rest = ble._fragment(payload)
+
+    ble._on_notification(1, first[:1])
+    if split == 2:
+        ble._on_notification(1, first[1:2])
+    ble._on_notification(1, first[split:])
+    for packet in rest:
+        ble._on_notification(1, packet)
+    await asyncio.sleep(0)
+
+    assert await ble.wait_for_response(timeout=0.1) == payload
+    assert ble._hdr_stash_len == 0
+
+
+@pytest.mark.asyncio
+async def test_ble_responses_drained_together():
+    """Test that responses completed before the event loop runs are handed over by a single drain, in order."""
+    import asyncio
+
+    from gopro_sdk.config import TimeoutConfig
+    from gopro_sdk.connection.ble_manager import BleConnectionManager
+
+    ble = BleConnectionManager("1332", TimeoutConfig())
+    scheduled = []
+    call_soon_threadsafe = ble._loop.call_soon_threadsafe
+
+    def record_call_soon_threadsafe(callback, *args):
+        scheduled.append(callback)
+        return call_soon_threadsafe(callback, *args)
+
+    ble._loop = type("Loop", (), {"call_soon_threadsafe": staticmethod(record_call_soon_threadsafe)})()
+    responses = [bytes([0x01, 0x00, index]) for index in range(3)]
+    for response in responses:
+        ble._on_notification(1, bytes([len(response)]) + response)
+
+    assert len(ble._pending_responses) == 3
+    assert len(scheduled) == 1
+
+    await asyncio.sleep(0)
+    assert [await ble.wait_for_response(timeout=0.1) for _ in responses] == responses
+    assert not ble._drain_scheduled
+
+
+@pytest.mark.asyncio
+async def test_download_files_batch(tmp_path, monkeypatch):
+    """Test that download_files keeps input order, captures per-file errors and bounds concurrency."""
+    import asyncio
+
+    from gopro_sdk.commands.media_commands import MediaCommands, MediaFile
+    from gopro_sdk.exceptions import HttpConnectionError
+
+    commands = MediaCommands(None)
+    in_flight = peak = 0
+    turbo = []
+
+    async def download_file(path, destination, callback):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later files finish first
+        await asyncio.sleep(0.01 * (4 - int(path[-5])))
+        in_flight -= 1
+        if path.endswith("2.MP4"):
+            raise HttpConnectionError("Download failed: HTTP 500")
+        callback(10, 10)
+        return int(path[-5]) * 100
+
+    async def set_turbo_mode(enable):
+        turbo.append(enable)
+
+    monkeypatch.setattr(commands, "download_file", download_file)
+    monkeypatch.setattr(commands, "set_turbo_mode", set_turbo_mode)
+
+    progress = []
+    media = [MediaFile("100GOPRO/GX010001.MP4", "0", "0"), "100GOPRO/GX010002.MP4", "100GOPRO/GX010003.MP4"]
+    results = await commands.download_files(
+        media, tmp_path, concurrency=2, progress_callback=lambda *args: progress.append(args)
+    )
+
+    assert results[0] == 100
+    assert isinstance(results[1], HttpConnectionError)
+    assert results[2] == 300
+    assert peak == 2
+    assert turbo == [True, False]
+    assert sorted(progress) == [("100GOPRO/GX010001.MP4", 10, 10), ("100GOPRO/GX010003.MP4", 10, 10)]
+
+    with pytest.raises(ValueError):
+        await commands.download_files(media, tmp_path, concurrency=0)
+    assert turbo == [True, False]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("properties", "expected_response"),
+    [(["write", "write-without-response"], False), (["write"], True)],
+)
+async def test_ble_write_without_response(properties, expected_response):
+    """Test that write(response=False) skips write responses only if the characteristic supports it."""
+    from types import SimpleNamespace
+
+    from gopro_sdk.config import TimeoutConfig
+    from gopro_sdk.connection.ble_manager import BleConnectionManager
+
+    writes = []
+
+    async def write_gatt_char(uuid, packet, response):
+        writes.append((bytes(packet), response))
+
+    characteristic = SimpleNamespace(properties=properties)
+    ble = BleConnectionManager("1332", TimeoutConfig())
+    ble._ble_client = SimpleNamespace(
+        services=SimpleNamespace(get_characteristic=lambda uuid: characteristic),
+        write_gatt_char=write_gatt_char,
+    )
+    payload = bytes(range(50))
+
+    await ble.write("b5f90072-aa8d-11e3-9046-0002a5d5c51b", payload, response=False)
+
+    assert [packet for packet, _ in writes] == ble._fragment(payload)
+    assert {response for _, response in writes} == {expected_response}
+
+    # Default: always wait for write responses
+    writes.clear()
+    await ble.write("b5f90072-aa8d-11e3-9046-0002a5d5c51b", payload)
+    assert {response for _, response in writes} == {True}